@@ -1,6 +1,6 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
 from enum import IntFlag, auto
-from typing import Dict
+from typing import Dict, Tuple
 from met_qt._internal.qtcompat import QtCore
 
 class EventInterest(IntFlag):
@@ -29,6 +29,12 @@ PROPERTY_EVENT_MAPPING: Dict[str, EventInterest] = {
     "focus": EventInterest.STATE,
 }
 
+# Reverse of PROPERTY_EVENT_MAPPING, the property names affected by each interest flag
+EVENT_INTEREST_TO_PROPS: Dict[EventInterest, Tuple[str, ...]] = {
+    interest: tuple(name for name, prop_interest in PROPERTY_EVENT_MAPPING.items() if prop_interest & interest)
+    for interest in EventInterest if interest
+}
+
 # Mapping of Qt events to their corresponding event interests
 EVENT_TO_INTEREST: Dict[QtCore.QEvent.Type, EventInterest] = {
     QtCore.QEvent.DynamicPropertyChange: EventInterest.DYNAMIC_PROPERTY,
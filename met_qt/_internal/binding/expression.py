@@ -1,9 +1,54 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
 import re
-from weakref import proxy
-from typing import Any, Dict, Callable
+import builtins
+import keyword
+from functools import lru_cache, partial
+from weakref import WeakMethod
+from typing import Any, Callable, Union
+from types import CodeType
 from met_qt._internal.qtcompat import QtCore
 
+_MISSING = object()
+
+_FMT_BRACE_RE = re.compile(r"{([^{}]*)}")
+_IDENT_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+_WORD_RE = re.compile(r"\w+")
+
+_DEFAULT_MATH_FUNCTIONS = {
+    "lerp": lambda a, b, t: a + (b - a) * t,
+    "clamp": lambda value, min_val, max_val: max(min(value, max_val), min_val),
+    "saturate": lambda value: max(0, min(value, 1))
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str, filename: str) -> Union[CodeType, str]:
+    """Compile an expression for eval, returning the source if it does not compile.
+    The source is returned so evaluation raises the original error at update time.
+    Code objects are immutable, so bindings sharing an expression share its compilation.
+    """
+    try:
+        return compile(expr, filename, 'eval')
+    except SyntaxError:
+        return expr
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _convert_numeric_str(value: Any) -> Any:
+    """Convert a property value for use in an eval expression, parsing numeric strings."""
+    if value in (None, ""):
+        return 0
+    elif isinstance(value, str):
+        if '.' in value:
+            return float(value)
+        else:
+            return int(value)
+    return value
+
+
 class ExpressionBinding:
     """
     Manages bindings from an expression with multiple variables to a target property.
@@ -27,15 +72,27 @@ class ExpressionBinding:
             expression_str: The expression string (format or eval).
             converter: Optional converter for the result.
         """
-        self._bindings_manager = proxy(bindings_manager)
+        # Weak so the manager's callbacks don't form a cycle through this binding
+        self._connect_to_property_changes = WeakMethod(bindings_manager._connect_to_property_changes)
         self._target = target
         self._target_property = target_property
         self._expression_str = expression_str
         self._converter = converter
         self._variables = {}
         self._bindings = {}
+        self._var_converters = {}
         self._locals = {}
+        # Evaluation namespace, kept in sync with _variables and _locals (locals take precedence)
+        self._eval_env = {}
         self._use_eval = self._determine_if_use_eval(expression_str)
+        self._ident_set = frozenset(_IDENT_RE.findall(expression_str))
+        # Expressions are evaluated on every property change, so compile them once here.
+        self._eval_globals = {"__builtins__": builtins}
+        self._code = _compile_expression(expression_str, f"<expr:{target_property}>") if self._use_eval else None
+        # A bare variable name is read straight from the environment rather than evaluated
+        name = expression_str.strip()
+        self._single_name = name if self._use_eval and name.isidentifier() and not keyword.iskeyword(name) else None
+        self._template_segments = [] if self._use_eval else self._parse_template(expression_str)
         self._updating = False
         self._building = False
         self._register_default_math_functions()
@@ -57,40 +114,27 @@ class ExpressionBinding:
         Returns:
             self
         """
-        pattern = r'\b' + re.escape(var_name) + r'\b'
-        if not re.search(pattern, self._expression_str):
+        if var_name not in self._ident_set:
             raise ValueError(f"Variable '{var_name}' not found in expression: {self._expression_str}")
-        self._bindings[var_name] = (obj, property_name, converter)
-        value = obj.property(property_name)
-        value = self._convert_value(value, converter)
-        self._variables[var_name] = value
-        self._bindings_manager._connect_to_property_changes(
-            obj, property_name, lambda: self._handle_property_change(var_name, obj, property_name))
+        connect_to_property_changes = self._connect_to_property_changes()
+        if connect_to_property_changes is None:
+            raise RuntimeError("The bindings manager for this expression has been deleted")
+        # Resolve the conversion once so property changes call it directly
+        if converter is not None:
+            convert = converter
+        elif self._use_eval:
+            convert = _convert_numeric_str
+        else:
+            convert = _identity
+        self._bindings[var_name] = (obj, property_name, convert)
+        self._var_converters[var_name] = convert
+        self._set_variable(var_name, convert(obj.property(property_name)))
+        connect_to_property_changes(
+            obj, property_name, partial(self._handle_property_change, var_name, obj, property_name))
         if not self._building:
             self._update_target()
         return self
 
-    def _convert_value(self, value: Any, converter: Callable[[Any], Any] = None) -> Any:
-        """
-        Convert the value using the provided converter or, if in eval mode, attempt to convert to float/int as needed.
-        Args:
-            value: The value to convert.
-            converter: Optional converter function.
-        Returns:
-            The converted value.
-        """
-        if converter is not None:
-            return converter(value)
-        elif self._use_eval:
-            if value in (None, ""):
-                return 0
-            elif isinstance(value, str):
-                if '.' in value:
-                    return float(value)
-                else:
-                    return int(value)
-        return value
-        
     def local(self, name: str, value: Any) -> 'ExpressionBinding':
         """
         Register a local value or function to be used in the expression.
@@ -101,6 +145,7 @@ class ExpressionBinding:
             self
         """
         self._locals[name] = value
+        self._eval_env[name] = value
         if not self._building:
             self._update_target()
         return self
@@ -109,11 +154,19 @@ class ExpressionBinding:
         """
         Register default math helper functions for expressions (lerp, clamp, saturate).
         """
-        self._locals.update({
-            "lerp": lambda a, b, t: a + (b - a) * t,
-            "clamp": lambda value, min_val, max_val: max(min(value, max_val), min_val),
-            "saturate": lambda value: max(0, min(value, 1))
-        })
+        self._locals.update(_DEFAULT_MATH_FUNCTIONS)
+        self._eval_env.update(_DEFAULT_MATH_FUNCTIONS)
+
+    def _set_variable(self, var_name: str, value: Any) -> None:
+        """
+        Store a bound variable value and expose it to the evaluation namespace.
+        Args:
+            var_name: The variable name in the expression.
+            value: The converted value.
+        """
+        self._variables[var_name] = value
+        if var_name not in self._locals:
+            self._eval_env[var_name] = value
         
     def _handle_property_change(self, var_name: str, obj: QtCore.QObject, property_name: str) -> None:
         """
@@ -127,10 +180,10 @@ class ExpressionBinding:
             return
         try:
             self._updating = True
-            value = obj.property(property_name)
-            _, _, converter = self._bindings[var_name]
-            value = self._convert_value(value, converter)
-            self._variables[var_name] = value
+            value = self._var_converters[var_name](obj.property(property_name))
+            if self._variables.get(var_name, _MISSING) == value:
+                return
+            self._set_variable(var_name, value)
             self._update_target()
         finally:
             self._updating = False
@@ -162,52 +215,55 @@ class ExpressionBinding:
         Returns:
             The result of the expression (type depends on expression and converter).
         """
-        eval_env = self._create_eval_environment()
+        eval_env = self._eval_env
+        if self._single_name is not None and self._single_name in eval_env:
+            return eval_env[self._single_name]
         if self._use_eval:
-            return eval(self._expression_str, globals(), eval_env)
+            return eval(self._code, self._eval_globals, eval_env)
         else:
-            result = self._expression_str
-            pattern = r"{([^{}]*)}"
-            matches = list(re.finditer(pattern, self._expression_str))
-            for match in reversed(matches):
-                expr = match.group(1)
-                start, end = match.span()
-                parts = expr.split(":")
-                if len(parts) > 1:
-                    var_name = parts[0].strip()
-                    format_spec = parts[1].strip()
+            parts = []
+            append = parts.append
+            for segment in self._template_segments:
+                kind = segment[0]
+                if kind == 'lit':
+                    append(segment[1])
+                elif kind == 'fmt':
+                    var_name = segment[1]
                     if var_name in eval_env:
-                        value = eval_env[var_name]
-                        formatted = format(value, format_spec)
-                        result = result[:start] + formatted + result[end:]
+                        append(format(eval_env[var_name], segment[2]))
                     else:
-                        result = result[:start] + f"<unknown: {var_name}>" + result[end:]
+                        append(f"<unknown: {var_name}>")
                 else:
                     try:
-                        value = eval(expr, globals(), eval_env)
-                        result = result[:start] + str(value) + result[end:]
+                        append(str(eval(segment[1], self._eval_globals, eval_env)))
                     except Exception as e:
-                        result = result[:start] + f"<error:{e}>" + result[end:]
-            return result
-    
-    def _create_eval_environment(self) -> Dict[str, Any]:
+                        append(f"<error:{e}>")
+            return ''.join(parts)
+
+    def _parse_template(self, expression_str: str) -> list:
         """
-        Create the environment dictionary for expression evaluation.
+        Split a format-string expression into literal and placeholder segments.
+        Args:
+            expression_str: The expression string.
         Returns:
-            A dictionary of variables and local helpers for eval/format.
+            A list of ('lit', text), ('fmt', var_name, format_spec) or ('eval', code) tuples.
         """
-        env = {}
-        env.update(self._variables)
-        env.update(self._locals)
-        
-        if "lerp" not in env:
-            env["lerp"] = lambda a, b, t: a + (b - a) * t
-        if "clamp" not in env:
-            env["clamp"] = lambda value, min_val, max_val: max(min(value, max_val), min_val)
-        if "saturate" not in env:
-            env["saturate"] = lambda value: max(0, min(value, 1))
-            
-        return env
+        segments = []
+        last = 0
+        for match in _FMT_BRACE_RE.finditer(expression_str):
+            start, end = match.span()
+            if start > last:
+                segments.append(('lit', expression_str[last:start]))
+            last = end
+            expr = match.group(1)
+            parts = expr.split(":")
+            if len(parts) > 1:
+                segments.append(('fmt', parts[0].strip(), parts[1].strip()))
+            else:
+                segments.append(('eval', _compile_expression(expr, "<fmt-expr>")))
+        if last < len(expression_str):
+            segments.append(('lit', expression_str[last:]))
+        return segments
     
     def _determine_if_use_eval(self, expression_str: str) -> bool:
         """
@@ -221,7 +277,7 @@ class ExpressionBinding:
         if any(op in expression_str for op in ['+', '-', '*', '/', '(', ')']):
             return True
         # If it's just a variable name
-        if re.fullmatch(r"\w+", expression_str.strip()):
+        if _WORD_RE.fullmatch(expression_str.strip()):
             return True
         return False
     
@@ -1,16 +1,21 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
 from __future__ import annotations
-from typing import Any, Callable, List
+from functools import partial
+from typing import Any, Callable, List, Optional
 from met_qt._internal.qtcompat import QtCore
-from .structs import Converter, BoundProperty
+from .structs import Converter, BoundProperty, _identity
 
 class GroupBinding:
     """Manages bidirectional bindings between multiple properties"""
-    def __init__(self, bindings_manager, initial_value=None):
-        self._bindings_manager = bindings_manager
+    def __init__(self, bindings_manager, initial_value=None, coalesce: bool = False):
+        self._connect_to_property_changes = bindings_manager._connect_to_property_changes
         self._properties: List[BoundProperty] = []
         self._normalized_value = initial_value
         self._updating = False
+        # When coalescing, changes are propagated once the event loop is idle
+        self._coalesce = coalesce
+        self._dirty_source: Optional[BoundProperty] = None
+        self._flush_scheduled = False
         
     def add(self, obj: QtCore.QObject, property_name: str, 
             to_normalized: Callable[[Any], Any] = None,
@@ -26,8 +31,8 @@ class GroupBinding:
         bound_prop = BoundProperty(obj, property_name, converter)
         self._properties.append(bound_prop)
         
-        self._bindings_manager._connect_to_property_changes(
-            obj, property_name, lambda: self._on_property_changed(bound_prop),
+        self._connect_to_property_changes(
+            obj, property_name, partial(self._on_property_changed, bound_prop),
             signal=signal)
         
         if self._normalized_value is not None:
@@ -44,6 +49,16 @@ class GroupBinding:
         if self._updating:
             return
             
+        if self._coalesce:
+            self._dirty_source = source_prop
+            self._normalized_value = source_prop.converter.to_normalized(
+                source_prop.obj.property(source_prop.property_name)
+            )
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                QtCore.QTimer.singleShot(0, self._flush)
+            return
+            
         try:
             self._updating = True
             new_value = source_prop.converter.to_normalized(
@@ -56,13 +71,35 @@ class GroupBinding:
                     self._update_property(prop)
         finally:
             self._updating = False
+
+    def _flush(self):
+        """Propagate the latest coalesced change to all other bound properties"""
+        source_prop = self._dirty_source
+        self._dirty_source = None
+        self._flush_scheduled = False
+        if self._updating:
+            return
+            
+        try:
+            self._updating = True
+            for prop in self._properties:
+                if prop is not source_prop:
+                    self._update_property(prop)
+        finally:
+            self._updating = False
     
     def _update_property(self, prop: BoundProperty):
         """Update a bound property with the current normalized value"""
         if self._normalized_value is None:
             return
             
-        converted_value = prop.converter.from_normalized(self._normalized_value)
+        from_normalized = prop.converter.from_normalized
+        if from_normalized is _identity:
+            converted_value = self._normalized_value
+        else:
+            converted_value = from_normalized(self._normalized_value)
+        if prop.obj.property(prop.property_name) == converted_value:
+            return
         prop.obj.setProperty(prop.property_name, converted_value)
         
     def update_value(self, value):
@@ -1,20 +1,27 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
-import uuid
+import itertools
 from typing import Any, Callable, List
 from dataclasses import dataclass
 from met_qt._internal.qtcompat import QtCore
 
+# Binding ids only need to be unique within the process
+_BINDING_IDS = itertools.count()
+
 class SimpleBinding:
     """Manages a one-way binding from a source property to one or more target properties"""
-    def __init__(self, source: QtCore.QObject, source_property: str):
-        self._uuid = uuid.uuid4()
+    def __init__(self, source: QtCore.QObject, source_property: str, bindings_manager=None):
+        self._id = next(_BINDING_IDS)
         self._source = source
         self._source_property = source_property
         self._targets = []
+        # Lets the manager index targets so their cleanup doesn't scan every binding
+        self._register_target = bindings_manager._register_target if bindings_manager is not None else None
     
     def to(self, target: QtCore.QObject, target_property: str, converter=None):
         """Add a target property to this binding"""
         self._targets.append((target, target_property, converter))
+        if self._register_target is not None:
+            self._register_target(self._id, target)
         return self
     
     def update_targets(self):
@@ -1,21 +1,40 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
-from typing import Any, Callable, List
-from dataclasses import dataclass
+from typing import Any, Callable
 from met_qt._internal.qtcompat import QtCore
 
-@dataclass
+
+def _identity(value):
+    return value
+
+
+# These are created per bound property, so they use __slots__ rather than
+# dataclasses, which only support slots from python 3.10.
 class Converter:
     """Represents bidirectional value converters for a property"""
-    to_normalized: Callable[[Any], Any] = lambda x: x
-    from_normalized: Callable[[Any], Any] = lambda x: x
+    __slots__ = ('to_normalized', 'from_normalized')
+
+    def __init__(self, to_normalized: Callable[[Any], Any] = _identity,
+                 from_normalized: Callable[[Any], Any] = _identity):
+        self.to_normalized = to_normalized
+        self.from_normalized = from_normalized
+
+    def __repr__(self):
+        return f"Converter(to_normalized={self.to_normalized!r}, from_normalized={self.from_normalized!r})"
+
 
-@dataclass
 class BoundProperty:
     """Represents a property that participates in a bidirectional binding group"""
-    obj: QtCore.QObject
-    property_name: str
-    converter: Converter = None
-    
-    def __post_init__(self):
-        if self.converter is None:
-            self.converter = Converter()
\ No newline at end of file
+    __slots__ = ('obj', 'property_name', 'converter')
+
+    def __init__(self, obj: QtCore.QObject, property_name: str, converter: Converter = None):
+        self.obj = obj
+        self.property_name = property_name
+        self.converter = Converter() if converter is None else converter
+
+    def __repr__(self):
+        return f"BoundProperty(obj={self.obj!r}, property_name={self.property_name!r}, converter={self.converter!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.obj, self.property_name, self.converter) == (other.obj, other.property_name, other.converter)
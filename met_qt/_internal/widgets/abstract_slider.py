@@ -8,6 +8,7 @@ import sys
 class AbstractSoftSlider(QtWidgets.QWidget):
     """
     Base class for custom sliders with a soft range
+    Subclasses define a slider_moved signal and must implement _slider_moved_args.
     """
     range_changed = QtCore.Signal(float, float)
     soft_range_changed = QtCore.Signal(float, float)
@@ -19,15 +20,31 @@ class AbstractSoftSlider(QtWidgets.QWidget):
 
     def __init__(self, orientation: QtCore.Qt.Orientation = QtCore.Qt.Horizontal, parent: Optional[QtWidgets.QWidget] = None):
         """Initialize the FloatSlider widget."""
+        if type(self)._slider_moved_args is AbstractSoftSlider._slider_moved_args:
+            # Fail here rather than from the move timer once a drag has started
+            raise TypeError(f"{type(self).__name__} must implement _slider_moved_args")
         super().__init__(parent)
+        # Layout values used by painting and mouse handling, cleared by _invalidate_cache
+        self._cached_groove_rect = None  # type: Optional[QtCore.QRect]
+        self._cached_visual_range = None  # type: Optional[tuple[float, float]]
+        self._cached_mult = None  # type: Optional[int]
+        self.orientation_changed.connect(self._invalidate_cache)
+        self.range_changed.connect(self._invalidate_cache)
+        self.soft_range_changed.connect(self._invalidate_cache)
         # Store ranges as tuples
         self._range = (0.0, 1.0)  # type: tuple[float, float]
         self._soft_range = None  # type: Optional[tuple[float, float]]
         self.orientation = orientation
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setMinimumSize(40, 20)
-        self._decimals = 4  # Number of decimal places for float values
-
+        self._decimals = 4  # Number of decimal places for float values, call _invalidate_cache after changing it
+        # Mouse moves can arrive far faster than the display refreshes,
+        # so slider_moved is coalesced to at most once per frame while dragging.
+        self._move_pending = False
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_slider_moved)
 
     @QtCore.Property('QVariant', notify=range_changed)
     def range(self) -> 'tuple[float, float]':
@@ -80,12 +97,36 @@ class AbstractSoftSlider(QtWidgets.QWidget):
             self.soft_range_changed.emit(*self._soft_range)
             self.update()
 
+    def _slider_moved_args(self) -> tuple:
+        """Abstract, return the arguments for the subclass's slider_moved signal.
+        Drag emissions are coalesced and emitted by _flush_slider_moved through this hook.
+        """
+        raise NotImplementedError
+
+    def _emit_slider_moved(self):
+        """Emit slider_moved with the current value(s)."""
+        self.slider_moved.emit(*self._slider_moved_args())
+
+    def _schedule_slider_moved(self):
+        """Queue a slider_moved emission for the next timer tick."""
+        self._move_pending = True
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_slider_moved(self):
+        """Emit any pending slider_moved immediately."""
+        self._move_timer.stop()
+        if self._move_pending:
+            self._move_pending = False
+            self._emit_slider_moved()
+
     def _bound(self, value: float) -> float:
         """Clamp value to the hard range."""
         value = min(max(value, self._range[0]), self._range[1])
         # round to step size
-        if self.single_step > 0:
-            value = round(value / self.single_step) * self.single_step
+        step = self.single_step
+        if step > 0:
+            value = round(value / step) * step
         return value
 
     def sizeHint(self) -> QtCore.QSize:
@@ -99,6 +140,37 @@ class AbstractSoftSlider(QtWidgets.QWidget):
         """Return the minimum recommended size for the widget."""
         return self.sizeHint()
 
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        self._invalidate_cache()
+        super().resizeEvent(event)
+
+    def _invalidate_cache(self, *args):
+        """Clear cached layout values after a geometry, orientation, range or decimals change."""
+        self._cached_groove_rect = None
+        self._cached_visual_range = None
+        self._cached_mult = None
+
+    def _get_groove_rect(self) -> QtCore.QRect:
+        """Return the cached groove rect."""
+        rect = self._cached_groove_rect
+        if rect is None:
+            rect = self._cached_groove_rect = self._groove_rect()
+        return rect
+
+    def _get_visual_range(self) -> 'tuple[float, float]':
+        """Return the cached visual range."""
+        visual_range = self._cached_visual_range
+        if visual_range is None:
+            visual_range = self._cached_visual_range = self._visual_range()
+        return visual_range
+
+    def _get_mult(self) -> int:
+        """Return the cached integer scale used to pass values to the style."""
+        mult = self._cached_mult
+        if mult is None:
+            mult = self._cached_mult = 10 ** self._decimals
+        return mult
+
     def _visual_range(self) -> 'tuple[float, float]':
         soft_min = self._soft_range[0] if self._soft_range is not None else self._range[0]
         soft_max = self._soft_range[1] if self._soft_range is not None else self._range[1]
@@ -109,7 +181,7 @@ class AbstractSoftSlider(QtWidgets.QWidget):
 
     def _value_to_pos(self, value: float, groove_rect: QtCore.QRect) -> int:
         """Map a value in [min, max] to a pixel position along the groove."""
-        vmin, vmax = self._visual_range()
+        vmin, vmax = self._get_visual_range()
         if self._orientation == QtCore.Qt.Horizontal:
             x0, x1 = groove_rect.left(), groove_rect.right()
             return int(x0 + (x1 - x0) * (value - vmin) / (vmax - vmin) if vmax > vmin else x0)
@@ -119,7 +191,7 @@ class AbstractSoftSlider(QtWidgets.QWidget):
 
     def _pos_to_value(self, pos: int, groove_rect: QtCore.QRect) -> float:
         """Map a pixel position along the groove to a value in [min, max]."""
-        vmin, vmax = self._visual_range()
+        vmin, vmax = self._get_visual_range()
         pos = float(pos)
         if self._orientation == QtCore.Qt.Horizontal:
             x0, x1 = float(groove_rect.left()), float(groove_rect.right())
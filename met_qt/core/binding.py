@@ -1,30 +1,81 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
 from typing import Dict, Any, Tuple, List, Callable, Set, Optional
-import uuid
 import re
+import weakref
+from functools import partial
+from collections import defaultdict
 
 from met_qt import constants
 from met_qt._internal.qtcompat import QtCore
 
 from met_qt._internal import binding as _binding
-from .meta import get_metamethod as _get_metamethod
+from .meta import get_metamethod as _get_metamethod, _decode
+
+_NO_PROPERTIES = frozenset()
+
+# Event interest flags as plain ints, so the event filter does int operations rather than IntFlag ones
+_INTEREST_NONE = int(_binding.constants.EventInterest.NONE)
+_INTEREST_DYNAMIC_PROPERTY = int(_binding.constants.EventInterest.DYNAMIC_PROPERTY)
+_EVENT_TO_INTEREST: Dict[QtCore.QEvent.Type, int] = {
+    event_type: int(interest) for event_type, interest in _binding.constants.EVENT_TO_INTEREST.items()}
+_PROPERTY_EVENT_MAPPING: Dict[str, int] = {
+    name: int(interest) for name, interest in _binding.constants.PROPERTY_EVENT_MAPPING.items()}
+_EVENT_INTEREST_TO_PROPS: Dict[int, Tuple[str, ...]] = {
+    int(interest): names for interest, names in _binding.constants.EVENT_INTEREST_TO_PROPS.items()}
+
+# Static property metadata is fixed per class, so it is shared between objects and managers.
+# Objects created by C++ can be of a subclass Python only knows by its nearest wrapped base, so
+# entries are keyed by the meta-object's class name within each Python type.
+# type -> (class name, property name) -> (property_index, notify_signal_index, notify_signal_name)
+_PROPERTY_META_CACHE: Dict[type, Dict[Tuple[str, str], Tuple[int, int, Optional[str]]]] = weakref.WeakKeyDictionary()
+
+def _get_property_meta(obj: QtCore.QObject, property_name: str) -> Tuple[int, int, Optional[str]]:
+    """Return (property_index, notify_signal_index, notify_signal_name) for a property"""
+    cache = _PROPERTY_META_CACHE.get(type(obj))
+    if cache is None:
+        cache = _PROPERTY_META_CACHE[type(obj)] = {}
+    meta_obj = obj.metaObject()
+    key = (meta_obj.className(), property_name)
+    entry = cache.get(key)
+    if entry is None:
+        property_index = meta_obj.indexOfProperty(property_name)
+        notify_idx = -1
+        notify_name = None
+        if property_index >= 0:
+            meta_property = meta_obj.property(property_index)
+            if meta_property.hasNotifySignal():
+                notify_idx = meta_property.notifySignalIndex()
+                notify_name = _decode(meta_property.notifySignal().name().data())
+        entry = cache[key] = (property_index, notify_idx, notify_name)
+    return entry
 
 
 class Bindings(QtCore.QObject):
-    """Core manager class for property bindings"""
-    def __init__(self, parent=None):
+    """Core manager class for property bindings
+    If coalesce is True, one-way bindings triggered by signals or events are updated
+    once per event loop iteration instead of immediately.
+    """
+    def __init__(self, parent=None, coalesce: bool = False):
         super().__init__(parent)
-        self._bindings: Dict[uuid.UUID, _binding.Binding] = {}
-        self._observed_objects = set()
-        self._signal_to_binding: Dict[Tuple[QtCore.QObject, int], uuid.UUID] = {}
-        self._object_event_interest: Dict[QtCore.QObject, _binding.constants.EventInterest] = {}
+        self._coalesce = coalesce
+        self._pending_updates: Dict[int, None] = {}  # ordered set of binding ids
+        self._flush_scheduled = False
+        self._bindings: Dict[int, _binding.SimpleBinding] = {}
+        # Object keyed state, released by _remove_bindings_for_object when the object is destroyed
+        self._bindings_by_source: Dict[QtCore.QObject, Dict[str, List[int]]] = {}
+        self._bindings_by_target: Dict[QtCore.QObject, Set[int]] = {}
+        self._observed_objects: Set[QtCore.QObject] = set()
+        self._signal_to_binding: Dict[QtCore.QObject, Dict[int, int]] = {}
+        self._object_event_interest: Dict[QtCore.QObject, int] = {}
         self._object_dynamic_properties: Dict[QtCore.QObject, Set[str]] = {}
-        self._property_callbacks: Dict[Tuple[QtCore.QObject, str], List[Callable]] = {}
+        self._property_callbacks: Dict[QtCore.QObject, Dict[str, List[Callable]]] = {}  # values are defaultdict(list)
+        self._notify_properties: Dict[QtCore.QObject, Dict[int, List[str]]] = {}
     
     def bind(self, source: QtCore.QObject, source_property: str, signal=None) -> _binding.SimpleBinding:
         """Create a one-way binding from a source property"""
-        binding = _binding.SimpleBinding(source, source_property)
-        self._bindings[binding._uuid] = binding
+        binding = _binding.SimpleBinding(source, source_property, self)
+        self._bindings[binding._id] = binding
+        self._bindings_by_source.setdefault(source, {}).setdefault(source_property, []).append(binding._id)
         
         signal_idx = self._setup_property_observation(source, source_property, signal)
         
@@ -32,13 +83,15 @@ class Bindings(QtCore.QObject):
         binding.update_targets()
         
         if signal_idx != -1:
-            self._signal_to_binding[(source, signal_idx)] = binding._uuid
+            self._signal_to_binding.setdefault(source, {})[signal_idx] = binding._id
         
         return binding
     
-    def bind_group(self, initial_value=None) -> _binding.GroupBinding:
-        """Create a new binding group for bidirectional binding"""
-        return _binding.GroupBinding(self, initial_value)
+    def bind_group(self, initial_value=None, coalesce: bool = False) -> _binding.GroupBinding:
+        """Create a new binding group for bidirectional binding
+        If coalesce is True, rapid changes are propagated once per event loop iteration.
+        """
+        return _binding.GroupBinding(self, initial_value, coalesce=coalesce)
     
     def bind_expression(self, target: QtCore.QObject, target_property: str, 
                        expression_str: str, converter: Callable = None) -> _binding.ExpressionBinding:
@@ -46,11 +99,11 @@ class Bindings(QtCore.QObject):
         binding = _binding.ExpressionBinding(self, target, target_property, expression_str, converter)
         return binding
         
-    @QtCore.Slot()
-    def _source_destroyed(self):
+    def _source_destroyed(self, object_ref: weakref.ref, *args):
         """Handle destruction of bound objects"""
-        object = self.sender()
-        if not object:
+        # sender() is a new base QObject wrapper by now, so resolve the original key instead
+        object = object_ref()
+        if object is None:
             return
         self._remove_bindings_for_object(object)
 
@@ -58,36 +111,32 @@ class Bindings(QtCore.QObject):
     def _property_changed(self, *args):
         """Handle property change notifications"""
         sender_obj = self.sender()
-        signal_idx = self.senderSignalIndex()
-        
         if not sender_obj:
             return
-            
-        key = (sender_obj, signal_idx)
+        signal_idx = self.senderSignalIndex()
         try:
-            if key in self._signal_to_binding:
-                binding_id = self._signal_to_binding[key]
-                self._update_binding(binding_id)
-            self._trigger_property_callbacks(sender_obj)
+            signal_bindings = self._signal_to_binding.get(sender_obj)
+            if signal_bindings:
+                binding_id = signal_bindings.get(signal_idx)
+                if binding_id is not None:
+                    if self._coalesce:
+                        self._schedule_update(binding_id)
+                    else:
+                        self._update_binding(binding_id)
+            self._trigger_property_callbacks(sender_obj, signal_idx)
         except Exception as e:
             # Protect against transient connection issues or object deletion
             pass
     
-    def _trigger_property_callbacks(self, obj: QtCore.QObject):
+    def _trigger_property_callbacks(self, obj: QtCore.QObject, signal_idx: int):
         """Trigger callbacks for property changes"""
-        meta_obj = obj.metaObject()
-        signal_idx = self.senderSignalIndex()
-        
-        for i in range(meta_obj.propertyCount()):
-            prop = meta_obj.property(i)
-            if prop.hasNotifySignal() and prop.notifySignalIndex() == signal_idx:
-                prop_name = prop.name()
-                key = (obj, prop_name)
-                if key in self._property_callbacks:
-                    for callback in self._property_callbacks[key]:
-                        callback()
-                break
-                
+        callbacks_by_property = self._property_callbacks.get(obj, {})
+        for prop_name in self._notify_properties.get(obj, {}).get(signal_idx, ()):
+            callbacks = callbacks_by_property.get(prop_name)
+            if callbacks:
+                for callback in callbacks:
+                    callback()
+
     def _setup_property_observation(self, obj: QtCore.QObject, property_name: str, 
                                    signal: Optional[QtCore.Signal] = None) -> int:
         """Setup property observation for an object and return the signal index if connected"""
@@ -95,131 +144,121 @@ class Bindings(QtCore.QObject):
         
         if obj not in self._observed_objects:
             obj.installEventFilter(self)
-            obj.destroyed.connect(self._source_destroyed)
+            obj.destroyed.connect(partial(self._source_destroyed, weakref.ref(obj)))
             self._observed_objects.add(obj)
-            self._object_event_interest[obj] = _binding.constants.EventInterest.NONE
+            self._object_event_interest[obj] = _INTEREST_NONE
             self._object_dynamic_properties[obj] = set()
         
-        meta_obj = obj.metaObject()
-        meta_property = None
-        property_index = meta_obj.indexOfProperty(property_name)
-        
-        if property_index >= 0:
-            meta_property = meta_obj.property(property_index)
+        _, notify_idx, notify_name = _get_property_meta(obj, property_name)
         
         if signal:
             signal.connect(self._property_changed)
-            meta_method = _get_metamethod(obj, signal)
-            signal_idx = meta_obj.indexOfSignal(meta_method.methodSignature().data().decode())
-        elif meta_property and meta_property.hasNotifySignal():
-            notify_signal = meta_property.notifySignal()
-            notifier = getattr(obj, str(notify_signal.name(), 'utf-8'))
-            notifier.connect(self._property_changed)
-            signal_idx = meta_obj.indexOfSignal(notify_signal.methodSignature().data().decode())
+            signal_idx = _get_metamethod(obj, signal).methodIndex()
+        elif notify_idx != -1:
+            getattr(obj, notify_name).connect(self._property_changed)
+            signal_idx = notify_idx
         elif property_name in constants.EVENT_PROPERTIES:
-            event_interest = _binding.constants.PROPERTY_EVENT_MAPPING.get(property_name, _binding.constants.EventInterest.NONE)
+            event_interest = _PROPERTY_EVENT_MAPPING.get(property_name, _INTEREST_NONE)
             self._object_event_interest[obj] |= event_interest
         else:
-            self._object_event_interest[obj] |= _binding.constants.EventInterest.DYNAMIC_PROPERTY
+            self._object_event_interest[obj] |= _INTEREST_DYNAMIC_PROPERTY
             self._object_dynamic_properties[obj].add(property_name)
         
+        if signal_idx != -1:
+            names = self._notify_properties.setdefault(obj, {}).setdefault(signal_idx, [])
+            if property_name not in names:
+                names.append(property_name)
+        
         return signal_idx
     
     def _connect_to_property_changes(self, obj: QtCore.QObject, property_name: str, 
                                      callback: Callable[[], None],
                                      signal: Optional[QtCore.Signal] = None):
         """Connect to property change notifications for an object"""
-        key = (obj, property_name)
-        if key not in self._property_callbacks:
-            self._property_callbacks[key] = []
-        
-        self._property_callbacks[key].append(callback)
+        callbacks_by_property = self._property_callbacks.get(obj)
+        if callbacks_by_property is None:
+            callbacks_by_property = self._property_callbacks[obj] = defaultdict(list)
+        callbacks_by_property[property_name].append(callback)
         self._setup_property_observation(obj, property_name, signal=signal)
 
-    def _update_binding(self, binding_id: uuid.UUID):
+    def _register_target(self, binding_id: int, target: QtCore.QObject):
+        """Record that a binding writes to target, so it can be detached when target is destroyed"""
+        binding_ids = self._bindings_by_target.get(target)
+        if binding_ids is None:
+            binding_ids = self._bindings_by_target[target] = set()
+            target.destroyed.connect(partial(self._source_destroyed, weakref.ref(target)))
+        binding_ids.add(binding_id)
+
+    def _update_binding(self, binding_id: int):
         """Update a binding's targets with the current source value"""
-        if binding_id in self._bindings:
-            self._bindings[binding_id].update_targets()
+        binding = self._bindings.get(binding_id)
+        if binding is not None:
+            binding.update_targets()
             
+    def _schedule_update(self, binding_id: int):
+        """Queue a binding update for the next event loop iteration"""
+        self._pending_updates[binding_id] = None
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_updates)
+
+    def _flush_updates(self):
+        """Update every binding queued since the last flush"""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        self._flush_scheduled = False
+        for binding_id in pending:
+            self._update_binding(binding_id)
+
     def _remove_bindings_for_object(self, obj: QtCore.QObject):
         """Remove all bindings associated with an object"""
         self._observed_objects.discard(obj)
         self._object_event_interest.pop(obj, None)
         self._object_dynamic_properties.pop(obj, None)
+        self._notify_properties.pop(obj, None)
+        self._signal_to_binding.pop(obj, None)
+        self._property_callbacks.pop(obj, None)
         
-        to_remove = []
-        for binding_id, binding in self._bindings.items():
-            if binding._source == obj:
-                to_remove.append(binding_id)
-            else:
-                binding._targets = [(target, prop, conv) for target, prop, conv in binding._targets 
-                                if target != obj]
+        for binding_ids in self._bindings_by_source.pop(obj, {}).values():
+            for binding_id in binding_ids:
+                self._bindings.pop(binding_id, None)
                 
-        for binding_id in to_remove:
-            self._bindings.pop(binding_id, None)
-            
-        keys_to_remove = []
-        for key in self._signal_to_binding:
-            sender, _ = key
-            if sender == obj:
-                keys_to_remove.append(key)
-                
-        for key in keys_to_remove:
-            self._signal_to_binding.pop(key, None)
-            
-        keys_to_remove = []
-        for key in self._property_callbacks:
-            callback_obj, _ = key
-            if callback_obj == obj:
-                keys_to_remove.append(key)
-                
-        for key in keys_to_remove:
-            self._property_callbacks.pop(key, None)
-            
+        for binding_id in self._bindings_by_target.pop(obj, ()):
+            binding = self._bindings.get(binding_id)
+            if binding is not None:
+                binding._targets[:] = [target for target in binding._targets if target[0] is not obj]
+
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         """Filter events for bound objects"""
-        if obj not in self._object_event_interest:
-            return False
-            
-        interest = self._object_event_interest.get(obj, _binding.constants.EventInterest.NONE)
-        if interest == _binding.constants.EventInterest.NONE:
+        interest = self._object_event_interest.get(obj)
+        if not interest:
             return False
             
         event_type = event.type()
-        event_interest = _binding.constants.EVENT_TO_INTEREST.get(event_type, _binding.constants.EventInterest.NONE)
-        
-        if event_interest == _binding.constants.EventInterest.NONE:
-            return False
-            
-        if not (interest & event_interest):
+        event_interest = _EVENT_TO_INTEREST.get(event_type)
+        if not event_interest or not (interest & event_interest):
             return False
             
         if event_type == QtCore.QEvent.DynamicPropertyChange:
-            property_name = event.propertyName().data().decode()
-            if property_name in self._object_dynamic_properties.get(obj, set()):
-                for binding_id, binding in self._bindings.items():
-                    if binding._source == obj and binding._source_property == property_name:
-                        self._update_binding(binding_id)
-        
+            # Decoded once, then shared by the binding updates and callbacks below
+            property_name = _decode(event.propertyName().data())
+            if property_name not in self._object_dynamic_properties.get(obj, _NO_PROPERTIES):
+                return False
+            property_names = (property_name,)
         else:
-            for binding_id, binding in self._bindings.items():
-                if binding._source == obj:
-                    property_interest = _binding.constants.PROPERTY_EVENT_MAPPING.get(binding._source_property, _binding.constants.EventInterest.NONE)
-                    if property_interest & event_interest:
-                        self._update_binding(binding_id)
+            property_names = _EVENT_INTEREST_TO_PROPS.get(event_interest, ())
         
-        if event_type == QtCore.QEvent.DynamicPropertyChange:
-            property_name = event.propertyName().data().decode()
-            key = (obj, property_name)
-            if key in self._property_callbacks:
-                for callback in self._property_callbacks[key]:
+        bindings_by_property = self._bindings_by_source.get(obj, {})
+        update_binding = self._schedule_update if self._coalesce else self._update_binding
+        for property_name in property_names:
+            for binding_id in bindings_by_property.get(property_name, ()):
+                update_binding(binding_id)
+        
+        callbacks_by_property = self._property_callbacks.get(obj, {})
+        for property_name in property_names:
+            callbacks = callbacks_by_property.get(property_name)
+            if callbacks:
+                for callback in callbacks:
                     callback()
-        elif event_interest != _binding.constants.EventInterest.NONE:
-            for prop_name, prop_interest in _binding.constants.PROPERTY_EVENT_MAPPING.items():
-                if prop_interest & event_interest:
-                    key = (obj, prop_name)
-                    if key in self._property_callbacks:
-                        for callback in self._property_callbacks[key]:
-                            callback()
         
-        return super().eventFilter(obj, event)
+        return False
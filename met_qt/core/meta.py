@@ -1,46 +1,88 @@
 # copyright (c) 2025 Alex Telford, http://minimaleffort.tech
-import re
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+import weakref
 from met_qt._internal.qtcompat import QtCore
 
+# Property and method names come from a small set, so their decoded strings are reused
+_DECODE_CACHE: Dict[bytes, str] = {}
+_DECODE_CACHE_LIMIT = 1024
+
+def _decode(data: bytes) -> str:
+    """Decode a utf-8 name, reusing the string from previous calls"""
+    text = _DECODE_CACHE.get(data)
+    if text is None:
+        text = data.decode('utf-8')
+        if len(_DECODE_CACHE) < _DECODE_CACHE_LIMIT:
+            _DECODE_CACHE[data] = text
+    return text
+
+_MISSING = object()
+
+# Objects created by C++ can be of a subclass Python only knows by its nearest wrapped base, so
+# entries are keyed by the meta-object's class name within each Python type, see _PROPERTY_META_CACHE.
+# type -> (class name, signal signature or slot name, method type) -> QMetaMethod
+_METAMETHOD_CACHE: Dict[type, Dict[Tuple[str, str, Any], Optional[QtCore.QMetaMethod]]] = weakref.WeakKeyDictionary()
+
 def get_metamethod(obj: QtCore.QObject, signal_or_slot) -> Optional[QtCore.QMetaMethod]:
     """Get the QMetaMethod of a signal in an object's meta-object
     eg:
         obj = QtCore.QObject()
         signal_method = get_metamethod(obj, obj.destroyed)
     """
-    match = re.search(r'SignalInstance (\w+)\(', repr(signal_or_slot))
-    if match:
-        # Signals aren't exposed to python, so we resolve it from the displayed signature.
-        name = match.group(1)
-        method_type = QtCore.QMetaMethod.MethodType.Signal
-    elif hasattr(signal_or_slot, '__name__'):
+    signature = None
+    if hasattr(signal_or_slot, '__name__'):
         name = signal_or_slot.__name__
         method_type = QtCore.QMetaMethod.MethodType.Slot
     else:
-        return None  # Likely not a signal
+        # Signals aren't exposed to python, so we resolve it from the displayed signature,
+        # eg: <PySide6.QtCore.SignalInstance valueChanged(int) at 0x...>
+        _, found, tail = repr(signal_or_slot).partition('SignalInstance ')
+        name, open_paren, tail = tail.partition('(')
+        if not found or not open_paren:
+            return None  # Likely not a signal
+        signature = tail.partition(')')[0]
+        method_type = QtCore.QMetaMethod.MethodType.Signal
     
-    meta_obj = obj.metaObject()
     if name.startswith('2'):  # Internally Qt prefixes slots and signals with 1 and 2.
         name = name[1:]
-        
+    if signature is not None:
+        signature = f"{name}({signature})"
+
+    # Methods are fixed per class, so the lookup only needs doing once per class
+    cache = _METAMETHOD_CACHE.get(type(obj))
+    if cache is None:
+        cache = _METAMETHOD_CACHE[type(obj)] = {}
+    meta_obj = obj.metaObject()
+    key = (meta_obj.className(), signature or name, method_type)
+    if key in cache:
+        return cache[key]
+
+    if signature is not None:
+        index = meta_obj.indexOfSignal(signature)
+        if index >= 0:
+            method = cache[key] = meta_obj.method(index)
+            return method
+
     # Get all methods with matching name first to avoid signature issues in PySide2
     matching_methods = []
     for i in range(meta_obj.methodCount()):
         method = meta_obj.method(i)
-        if method.methodType() == method_type and method.name().data().decode() == name:
+        if method.methodType() == method_type and _decode(method.name().data()) == name:
             matching_methods.append(method)
             
     # If we found exactly one match, return it
     if len(matching_methods) == 1:
-        return matching_methods[0]
+        method = matching_methods[0]
     
     # If we have multiple matches, try to find the best one by signature
-    if matching_methods:
+    elif matching_methods:
         # In PySide2, some methods might not have signatures, return the first one in that case
-        return matching_methods[0]
+        method = matching_methods[0]
     
-    return None
+    else:
+        method = None
+    cache[key] = method
+    return method
 
 def QProperty(name:str, type_, default=None, *, signal=False,
               converter=None, default_factory=None,
@@ -70,20 +112,31 @@ def QProperty(name:str, type_, default=None, *, signal=False,
     """
     variable_name = variable_name or f"_{name}"
     signal_name = signal_name or f"{name}Changed"
-    converter = converter or (lambda x:x)
     def fget(self):
-        if not hasattr(self, variable_name):
-            setattr(self, variable_name, default_factory() if default_factory else default)
-        return getattr(self, variable_name)
+        # Backing values normally live in the instance dict, so try it first and fall
+        # back to attribute lookup for class level defaults and descriptors
+        value = self.__dict__.get(variable_name, _MISSING)
+        if value is _MISSING:
+            if not hasattr(self, variable_name):
+                setattr(self, variable_name, default_factory() if default_factory else default)
+            value = getattr(self, variable_name)
+        return value
     
-    def fset(self, value):
-        value = converter(value)
-        current = fget(self)
-        if current == value:
-            return
-        setattr(self, variable_name, value)
-        if signal:
-            getattr(self, signal_name).emit(value)
+    if converter is None:
+        def fset(self, value):
+            if fget(self) == value:
+                return
+            setattr(self, variable_name, value)
+            if signal:
+                getattr(self, signal_name).emit(value)
+    else:
+        def fset(self, value):
+            value = converter(value)
+            if fget(self) == value:
+                return
+            setattr(self, variable_name, value)
+            if signal:
+                getattr(self, signal_name).emit(value)
     
     def freset(self):
         setattr(self, variable_name, default_factory() if default_factory else default)
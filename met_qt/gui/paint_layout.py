@@ -4,8 +4,9 @@ For most cases you can simply use anchor() from paint_utils, this is for
 advanced cases where you require hover support or complex layout management in
 a situation where you cannot use normal widgets.
 """
-from typing import Optional, Union, List, Set
-from dataclasses import dataclass, field, asdict, replace
+from typing import Dict, Optional, Union, List, Set
+from dataclasses import dataclass, field
+from functools import lru_cache
 from met_qt._internal.qtcompat import QtWidgets, QtCore, QtGui
 from enum import Enum, Flag, auto, IntFlag
 
@@ -21,6 +22,19 @@ class CornerFlag(IntFlag):
     BottomRight = auto()
     AllCorners = TopLeft | TopRight | BottomLeft | BottomRight
 
+# Plain ints for testing corners in the path builder, IntFlag operators are comparatively slow
+_TOP_LEFT = int(CornerFlag.TopLeft)
+_TOP_RIGHT = int(CornerFlag.TopRight)
+_BOTTOM_LEFT = int(CornerFlag.BottomLeft)
+_BOTTOM_RIGHT = int(CornerFlag.BottomRight)
+# (corner bit, on right edge, on bottom edge, arc start angle) clockwise from the top right
+_CORNER_TABLE = (
+    (_TOP_RIGHT, 1, 0, 90),
+    (_BOTTOM_RIGHT, 1, 1, 0),
+    (_BOTTOM_LEFT, 0, 1, 270),
+    (_TOP_LEFT, 0, 0, 180),
+)
+
 class PaintOptions(IntFlag):
     NoOptions = 0
     Enabled = auto()
@@ -31,6 +45,13 @@ class BoxPaintLayoutFlag(IntFlag):
     Visible = auto()
     TransparentForHover = auto()
 
+# Plain int options and layout flags for the paint walk, see _TOP_LEFT
+_PAINT_ENABLED = int(PaintOptions.Enabled)
+_PAINT_HOVERED = int(PaintOptions.Hovered)
+_LAYOUT_ENABLED = int(BoxPaintLayoutFlag.Enabled)
+_LAYOUT_VISIBLE = int(BoxPaintLayoutFlag.Visible)
+_LAYOUT_TRANSPARENT_FOR_HOVER = int(BoxPaintLayoutFlag.TransparentForHover)
+
 @dataclass
 class PaintStyle:
     brush_color: QtGui.QColor = None  # QColor or None
@@ -39,6 +60,106 @@ class PaintStyle:
     pen_role: QtGui.QPalette.ColorRole = None
     pen_width: float = 1.0
 
+_DEFAULT_STYLE = PaintStyle()  # shared, never modified
+
+# QFontMetrics by QFont.key(), shared by texts using the same font
+_FONT_METRICS: Dict[str, QtGui.QFontMetrics] = {}
+_FONT_METRICS_LIMIT = 64
+
+def _font_metrics(font: QtGui.QFont) -> QtGui.QFontMetrics:
+    key = font.key()
+    metrics = _FONT_METRICS.get(key)
+    if metrics is None:
+        metrics = QtGui.QFontMetrics(font)
+        if len(_FONT_METRICS) < _FONT_METRICS_LIMIT:
+            _FONT_METRICS[key] = metrics
+    return metrics
+
+_COLOR_CACHE: Dict[tuple, QtGui.QColor] = {}
+_COLOR_CACHE_LIMIT = 256
+
+def _role_color(palette: QtGui.QPalette, role) -> QtGui.QColor:
+    # cacheKey() changes whenever the palette is modified, so stale entries are never hit.
+    # It doesn't cover the current colour group, which follows the widget's enabled and active state.
+    key = (palette.cacheKey(), palette.currentColorGroup(), role)
+    color = _COLOR_CACHE.get(key)
+    if color is None:
+        if len(_COLOR_CACHE) > _COLOR_CACHE_LIMIT:
+            _COLOR_CACHE.clear()
+        color = _COLOR_CACHE[key] = palette.color(role)
+    return color
+
+_PALETTE_WATCHER = None
+
+class _PaletteWatcher(QtCore.QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watching_app = False
+        self._watched_style = None
+
+    def watch_app_defaults(self, style: QtWidgets.QStyle):
+        """Drops BoxPaintItem's application palette and style when either changes."""
+        if not self._watching_app:
+            QtWidgets.QApplication.instance().paletteChanged.connect(self._reset_app_defaults)
+            self._watching_app = True
+        # QApplication.setStyle deletes the previous style without sending the application an event.
+        # Defaults are re-resolved after every palette change, connect each style only once.
+        if style is not self._watched_style:
+            style.destroyed.connect(self._reset_app_defaults)
+            self._watched_style = style
+
+    def _reset_app_defaults(self, *args):
+        BoxPaintItem.reset_app_defaults()
+
+def _palette_watcher() -> _PaletteWatcher:
+    global _PALETTE_WATCHER
+    if _PALETTE_WATCHER is None:
+        _PALETTE_WATCHER = _PaletteWatcher()
+    return _PALETTE_WATCHER
+
+def _rgba(color) -> int:
+    # Styles may hold Qt.GlobalColor or names as well as QColor
+    if not isinstance(color, QtGui.QColor):
+        color = QtGui.QColor(color)
+    return color.rgba()
+
+# Brushes and pens are implicitly shared, these are only ever passed to setBrush/setPen
+@lru_cache(maxsize=128)
+def _brush(rgba: int) -> QtGui.QBrush:
+    return QtGui.QBrush(QtGui.QColor.fromRgba(rgba))
+
+@lru_cache(maxsize=128)
+def _pen(rgba: int, width: float) -> QtGui.QPen:
+    return QtGui.QPen(QtGui.QColor.fromRgba(rgba), width)
+
+class _PainterState:
+    """Brush, pen and font last set on a painter between one save/restore pair.
+    Brushes and pens come from the shared caches, so identity is enough to skip repeated sets.
+    """
+    __slots__ = ('brush', 'pen', 'font', 'base_pen')
+
+    def __init__(self, painter):
+        self.brush = None
+        self.pen = None
+        self.font = None
+        # Text is drawn with the pen the painter had before any box set one
+        self.base_pen = painter.pen()
+
+    def set_brush(self, painter, brush):
+        if brush is not self.brush:
+            painter.setBrush(brush)
+            self.brush = brush
+
+    def set_pen(self, painter, pen):
+        if pen is not self.pen:
+            painter.setPen(pen)
+            self.pen = pen
+
+    def set_font(self, painter, font):
+        if font is not self.font:
+            painter.setFont(font)
+            self.font = font
+
 @dataclass
 class PaintItem:
     id: Optional[str] = None
@@ -50,6 +171,8 @@ class PaintItem:
 @dataclass
 class BoxShape(PaintItem):
     shape_type: ShapeType = ShapeType.Box
+    # Painted paths are cached per item and matched by identity, assign a new path
+    # to change it rather than modifying this one in place.
     painter_path: QtGui.QPainterPath = None
     corner_radius: int = 0  # Default to 0 for normal box
     rounded_corners: CornerFlag = CornerFlag.AllCorners
@@ -67,30 +190,62 @@ class BoxText(PaintItem):
     colorRole: QtGui.QPalette.ColorRole = QtGui.QPalette.ColorRole.WindowText
     font: QtGui.QFont = field(default_factory=QtGui.QFont)
     elideMode: QtCore.Qt.TextElideMode = QtCore.Qt.TextElideMode.ElideNone
+    # ((font key, text), size) of the last sizeHint
+    _size_hint_cache: tuple = field(default=(None, None), init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.style is None:
             self.style = PaintStyle()
 
     def sizeHint(self):
-        metrics = QtGui.QFontMetrics(self.font)
-        lines = self.text.splitlines() or ['']
-        width = max(metrics.horizontalAdvance(line) for line in lines)
-        height = metrics.height() * len(lines)
-        return QtCore.QSize(width, height)
+        key = (self.font.key(), self.text)
+        cached_key, size = self._size_hint_cache
+        if key != cached_key:
+            metrics = _font_metrics(self.font)
+            lines = self.text.splitlines() or ['']
+            width = max(map(metrics.horizontalAdvance, lines))
+            height = metrics.height() * len(lines)
+            size = QtCore.QSize(width, height)
+            self._size_hint_cache = (key, size)
+        return QtCore.QSize(size)
+
+def _has_rounded_corners(shape: BoxShape) -> bool:
+    """A box with no radius or no rounded corners is drawn as a plain rect, skipping the path code.
+    Any new corner options must keep this returning False when nothing would be rounded.
+    """
+    return bool(shape.corner_radius) and shape.corner_radius > 0 and shape.rounded_corners != CornerFlag.NoCorners
 
 class BoxPaintItem:
+    # Application palette/style used when painting without a widget, resolved on first use
+    # and dropped automatically when the application palette or style changes.
+    _app_palette: Optional[QtGui.QPalette] = None
+    _app_style: Optional[QtWidgets.QStyle] = None
+
     def __init__(self, shape: Union[None, BoxShape] = None, text: Union[str, BoxText] = None):
         self.shape = shape
         if isinstance(text, str):
             text = BoxText(text=text)
         self.text = text
+        # (shape, source path, key, path) of the last resolved path, hit testing and painting
+        # resolve the same one each frame. The shape and source path are held so they're matched
+        # by identity, ids could be reused once they're released.
+        self._path_cache = (None, None, None, None)
+        # (id(base), id(overlay)) -> (field values, merged style) of recently merged styles
+        self._style_cache: Dict[tuple, tuple] = {}
 
     def paint(self, painter, rect, widget=None, options=PaintOptions.Enabled):
+        if not (self.shape and self.shape.visible) and not (self.text and self.text.visible and self.text.text):
+            return
+        painter.save()
+        self._paint(painter, rect, widget, options, _PainterState(painter))
+        painter.restore()
+
+    def _paint(self, painter, rect, widget, options, state: _PainterState):
+        # Painter state must be saved by the caller, state tracks what has been set since
         if self.shape and self.shape.visible:
-            self._draw_box(painter, self.shape, rect, widget, options)
+            self._draw_box(painter, self.shape, rect, widget, options, state)
         if self.text and self.text.visible and self.text.text:
-            self._draw_text(painter, self.text, rect, widget, options)
+            self._draw_text(painter, self.text, rect, widget, options, state)
 
     def hit_test(self, rect, pos):
         hit = False
@@ -98,41 +253,82 @@ class BoxPaintItem:
             hit = False
         elif self.shape.shape_type == ShapeType.Box:
             hit = rect.contains(pos)
-        else:
+        elif rect.contains(pos):
+            # Paths are scaled into the rect, so nothing outside it can hit
             path = self._resolve_path(self.shape, rect)
             hit = not path.isEmpty() and path.contains(QtCore.QPointF(pos))
         return hit
 
+    @classmethod
+    def reset_app_defaults(cls):
+        """Drops the cached application palette and style."""
+        cls._app_palette = None
+        cls._app_style = None
+
+    @classmethod
+    def _app_defaults(cls):
+        if cls._app_palette is None:
+            cls._app_palette = QtWidgets.QApplication.palette()
+            cls._app_style = QtWidgets.QApplication.style()
+            _palette_watcher().watch_app_defaults(cls._app_style)
+        return cls._app_palette, cls._app_style
+
     def _resolve_style(self, base: Optional[PaintStyle], disabled_style: Optional[PaintStyle], hover_style: Optional[PaintStyle], options:PaintOptions) -> PaintStyle:
-        base = base or PaintStyle()
-        if not (options & PaintOptions.Enabled) and disabled_style:
-            return replace(base, **{k:v for k, v in asdict(disabled_style).items() if v is not None})
-        if (options & PaintOptions.Hovered) and hover_style:
-            return replace(base, **{k:v for k, v in asdict(hover_style).items() if v is not None})
-        return base
-
-    def _draw_box(self, painter, shape: BoxShape, rect, widget=None, options:PaintOptions=PaintOptions.Enabled):
-        painter.save()
+        base = base or _DEFAULT_STYLE
+        if not (options & _PAINT_ENABLED) and disabled_style:
+            overlay = disabled_style
+        elif (options & _PAINT_HOVERED) and hover_style:
+            overlay = hover_style
+        else:
+            return base
+        # Styles are mutable and QColor is unhashable, so cached merges are checked against the
+        # current field values. Unchanged fields are the same objects, which compare by identity.
+        # Values are in PaintStyle field order, base then overlay.
+        values = (base.brush_color, base.brush_role, base.pen_color, base.pen_role, base.pen_width,
+                  overlay.brush_color, overlay.brush_role, overlay.pen_color, overlay.pen_role, overlay.pen_width)
+        key = (id(base), id(overlay))
+        cached = self._style_cache.get(key)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        # Fields set on the overlay win, unset (None) fields fall back to the base
+        merged = PaintStyle(
+            values[0] if values[5] is None else values[5],
+            values[1] if values[6] is None else values[6],
+            values[2] if values[7] is None else values[7],
+            values[3] if values[8] is None else values[8],
+            values[4] if values[9] is None else values[9],
+        )
+        if len(self._style_cache) >= 4:
+            self._style_cache.clear()
+        self._style_cache[key] = (values, merged)
+        return merged
+
+    def _draw_box(self, painter, shape: BoxShape, rect, widget, options: PaintOptions, state: _PainterState):
         style = self._resolve_style(shape.style, shape.disabled_style, shape.hover_style, options)
         color = style.brush_color
         if color is None and style.brush_role is not None and widget:
-            color = widget.palette().color(style.brush_role)
-        if color is not None:
-            painter.setBrush(QtGui.QBrush(color))
-        else:
-            painter.setBrush(QtCore.Qt.NoBrush)
+            color = _role_color(widget.palette(), style.brush_role)
         pen_color = style.pen_color
         if pen_color is None and widget and style.pen_role:
-            pen_color = widget.palette().color(style.pen_role)
+            pen_color = _role_color(widget.palette(), style.pen_role)
+        if color is None and not pen_color:
+            # Nothing would be filled or stroked, leave the painter untouched
+            return
+        if color is not None:
+            state.set_brush(painter, _brush(_rgba(color)))
+        else:
+            state.set_brush(painter, QtCore.Qt.NoBrush)
         if not pen_color:
-            painter.setPen(QtCore.Qt.NoPen)
+            state.set_pen(painter, QtCore.Qt.NoPen)
         else:
-            painter.setPen(QtGui.QPen(pen_color, style.pen_width))
+            state.set_pen(painter, _pen(_rgba(pen_color), style.pen_width))
         if shape.shape_type == ShapeType.Box:
-            if shape.corner_radius and shape.corner_radius > 0:
+            if _has_rounded_corners(shape):
                 if shape.rounded_corners == CornerFlag.AllCorners:
                     painter.drawRoundedRect(rect, shape.corner_radius, shape.corner_radius)
                 else:
+                    # Partial corners use the cached path, splitting the box into clipped rounded and
+                    # square halves would stroke the seam and leave antialiasing gaps along it.
                     path = self._resolve_path(shape, rect)
                     if not path.isEmpty():
                         painter.drawPath(path)
@@ -142,81 +338,75 @@ class BoxPaintItem:
             path = self._resolve_path(shape, rect)
             if not path.isEmpty():
                 painter.drawPath(path)
-        painter.restore()
 
-    def _draw_text(self, painter, text: BoxText, rect, widget=None, options:PaintOptions=PaintOptions.Enabled):
-        painter.save()
+    def _draw_text(self, painter, text: BoxText, rect, widget, options: PaintOptions, state: _PainterState):
         style = self._resolve_style(text.style, text.disabled_style, text.hover_style, options)
-        painter.setFont(text.font)
+        state.set_font(painter, text.font)
+        state.set_pen(painter, state.base_pen)
         color = style.brush_color
-        palette = widget.palette() if widget else QtWidgets.QApplication.palette()
-        if color is None:
-            color = palette.color(style.pen_role or QtGui.QPalette.ColorRole.WindowText)
-        style_widget = widget.style() if widget else QtWidgets.QApplication.style()
+        role = style.pen_role or QtGui.QPalette.ColorRole.WindowText
+        if widget:
+            style_widget = widget.style()
+            if color is None:
+                color = _role_color(widget.palette(), role)
+        else:
+            palette, style_widget = self._app_defaults()
+            if color is None:
+                color = _role_color(palette, role)
         style_widget.drawItemText(painter, rect, int(text.alignment), color, True, text.text)
-        painter.restore()
 
     def _resolve_path(self, shape, rect):
         # Returns a QPainterPath for the shape in the given rect
+        # The cached path is shared, callers must not modify it.
+        # Paths are matched by identity, so replace shape.painter_path rather than editing it in place.
+        source_path = shape.painter_path
+        key = (shape.shape_type, shape.corner_radius, int(shape.rounded_corners),
+               rect.x(), rect.y(), rect.width(), rect.height())
+        cached_shape, cached_source, cached_key, cached_path = self._path_cache
+        if shape is cached_shape and source_path is cached_source and key == cached_key:
+            return cached_path
+        path = self._build_path(shape, rect)
+        self._path_cache = (shape, source_path, key, path)
+        return path
+
+    def _build_path(self, shape, rect):
         path = QtGui.QPainterPath()
         if shape.shape_type == ShapeType.Box:
-            if shape.corner_radius and shape.corner_radius > 0:
-                if shape.rounded_corners == CornerFlag.AllCorners:
-                    path.addRoundedRect(QtCore.QRectF(rect), shape.corner_radius, shape.corner_radius)
-                else:
-                    if shape.rounded_corners & CornerFlag.TopLeft:
-                        path.moveTo(rect.left() + shape.corner_radius, rect.top())
-                    else:
-                        path.moveTo(rect.left(), rect.top())
-                    if shape.rounded_corners & CornerFlag.TopRight:
-                        path.lineTo(rect.right() - shape.corner_radius, rect.top())
-                        path.arcTo(
-                            rect.right() - shape.corner_radius * 2, rect.top(),
-                            shape.corner_radius * 2, shape.corner_radius * 2,
-                            90, -90
-                        )
-                    else:
-                        path.lineTo(rect.right(), rect.top())
-                    if shape.rounded_corners & CornerFlag.BottomRight:
-                        path.lineTo(rect.right(), rect.bottom() - shape.corner_radius)
-                        path.arcTo(
-                            rect.right() - shape.corner_radius * 2, rect.bottom() - shape.corner_radius * 2,
-                            shape.corner_radius * 2, shape.corner_radius * 2,
-                            0, -90
-                        )
-                    else:
-                        path.lineTo(rect.right(), rect.bottom())
-                    if shape.rounded_corners & CornerFlag.BottomLeft:
-                        path.lineTo(rect.left() + shape.corner_radius, rect.bottom())
-                        path.arcTo(
-                            rect.left(), rect.bottom() - shape.corner_radius * 2,
-                            shape.corner_radius * 2, shape.corner_radius * 2,
-                            270, -90
-                        )
-                    else:
-                        path.lineTo(rect.left(), rect.bottom())
-                    if shape.rounded_corners & CornerFlag.TopLeft:
-                        path.lineTo(rect.left(), rect.top() + shape.corner_radius)
-                        path.arcTo(
-                            rect.left(), rect.top(),
-                            shape.corner_radius * 2, shape.corner_radius * 2,
-                            180, -90
-                        )
-                    else:
-                        path.lineTo(rect.left(), rect.top())
-                    path.closeSubpath()
-            else:
+            if not _has_rounded_corners(shape):
                 path.addRect(QtCore.QRectF(rect))
+                return path
+            if shape.rounded_corners == CornerFlag.AllCorners:
+                path.addRoundedRect(QtCore.QRectF(rect), shape.corner_radius, shape.corner_radius)
+            else:
+                corners = int(shape.rounded_corners)
+                r = shape.corner_radius
+                d = r + r
+                left, top = rect.left(), rect.top()
+                width, height = rect.right() - left, rect.bottom() - top
+                # arcTo joins its start point with a line, so rounded corners need no lineTo
+                path.moveTo(left + r if corners & _TOP_LEFT else left, top)
+                for bit, sx, sy, start in _CORNER_TABLE:
+                    x = left + sx * width
+                    y = top + sy * height
+                    if corners & bit:
+                        path.arcTo(x - sx * d, y - sy * d, d, d, start, -90)
+                    else:
+                        path.lineTo(x, y)
+                path.closeSubpath()
         elif shape.shape_type == ShapeType.Path and shape.painter_path:
-            source_rect = shape.painter_path.boundingRect()
-            path = QtGui.QPainterPath(shape.painter_path)
-            if not source_rect.isEmpty():
-                transform = QtGui.QTransform()
-                scale_x = rect.width() / source_rect.width()
-                scale_y = rect.height() / source_rect.height()
-                transform.translate(rect.x() - source_rect.x() * scale_x, rect.y() - source_rect.y() * scale_y)
-                transform.scale(scale_x, scale_y)
-                path = transform.map(path)
+            # The source path is returned as is when it already fills the rect, it is never modified
+            source_path = shape.painter_path
+            source_rect = source_path.boundingRect()
+            if source_rect.isEmpty() or (
+                    source_rect.x() == rect.x() and source_rect.y() == rect.y()
+                    and source_rect.width() == rect.width() and source_rect.height() == rect.height()):
+                return source_path
+            transform = QtGui.QTransform()
+            scale_x = rect.width() / source_rect.width()
+            scale_y = rect.height() / source_rect.height()
+            transform.translate(rect.x() - source_rect.x() * scale_x, rect.y() - source_rect.y() * scale_y)
+            transform.scale(scale_x, scale_y)
+            path = transform.map(source_path)
         return path
 
 
@@ -239,13 +429,15 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
         self._explicit_max_size: Optional[QtCore.QSize] = None
         self._paint_items: List[BoxPaintItem] = []
         self._flags: BoxPaintLayoutFlag = BoxPaintLayoutFlag.Enabled | BoxPaintLayoutFlag.Visible
+        self._flags_int = int(self._flags)
+        self._size_hint_cache: Optional[QtCore.QSize] = None
 
     @QtCore.Property(int)
     def flags(self) -> int:
         """
         Get the current layout flags as an integer.
         """
-        return int(self._flags)
+        return self._flags_int
 
     @flags.setter
     def flags(self, value: int):
@@ -255,6 +447,7 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
             value (int): The new flags value.
         """
         self._flags = BoxPaintLayoutFlag(value)
+        self._flags_int = int(self._flags)
         self.update()
         self.invalidate()
 
@@ -296,11 +489,15 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
         Return the preferred size (explicit or calculated).
         The size is determined by the union of all paint items' size hints and margins.
         Returns (0, 0) if there are no paint items.
+        The result is cached until the layout is invalidated, call invalidate() after
+        editing a paint item's text, font or margin in place.
         """
         if self._explicit_size_hint:
             return self._explicit_size_hint
         if not self._paint_items:
             return QtCore.QSize(0, 0)
+        if self._size_hint_cache is not None:
+            return QtCore.QSize(self._size_hint_cache)
         max_width = 0
         max_height = 0
         for item in self._paint_items:
@@ -312,10 +509,18 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
             max_width = max(max_width, text_size.width() + 2 * margin)
             max_height = max(max_height, text_size.height() + 2 * margin)
         base_hint = super().sizeHint()
-        return QtCore.QSize(
+        self._size_hint_cache = QtCore.QSize(
             max(base_hint.width(), max_width),
             max(base_hint.height(), max_height)
         )
+        return QtCore.QSize(self._size_hint_cache)
+
+    def invalidate(self):
+        """
+        Invalidate cached layout information, including the paint item size hint.
+        """
+        self._size_hint_cache = None
+        super().invalidate()
 
     def minimumSize(self) -> QtCore.QSize:
         """
@@ -358,47 +563,57 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
             options: Paint options (enabled, hovered, etc).
             mouse_pos: Mouse position for hover detection.
         """
+        if not self._paint_items:
+            return
         layout_geom = self.geometry()
+        device = painter.device()
+        widget = device if isinstance(device, QtWidgets.QWidget) else None
+        # One save/restore for the whole layout, items only set what changed between them
+        painter.save()
+        state = _PainterState(painter)
+        options = int(options)
+        base_flags = _PAINT_ENABLED if options & _PAINT_ENABLED and self._flags_int & _LAYOUT_ENABLED else 0
+        hover = options & _PAINT_HOVERED and mouse_pos is not None
         for item in self._paint_items:
-            item_flags = PaintOptions.NoOptions
-            enabled = options & PaintOptions.Enabled and self.flags & BoxPaintLayoutFlag.Enabled
-            if enabled:
-                item_flags |= PaintOptions.Enabled
-            if options & PaintOptions.Hovered and mouse_pos is not None:
-                if item.hit_test(layout_geom, mouse_pos):
-                    item_flags |= PaintOptions.Hovered
-            item.paint(painter,
-                       layout_geom,
-                       widget=painter.device() if isinstance(painter.device(), QtWidgets.QWidget) else None,
-                       options=item_flags)
+            item_flags = base_flags
+            if hover and item.hit_test(layout_geom, mouse_pos):
+                item_flags |= _PAINT_HOVERED
+            item._paint(painter, layout_geom, widget, item_flags, state)
+        painter.restore()
 
     @classmethod
-    def _recurse_paint(cls, layout: QtWidgets.QLayout, painter: QtGui.QPainter, mouse_pos: Optional[QtCore.QPoint], hovered_layouts: Set['BoxPaintLayout']):
+    def _recurse_paint(cls, layout: QtWidgets.QLayout, mouse_pos: Optional[QtCore.QPoint], visible: bool, entries: list):
         """
-        Recursively paint BoxPaintLayout items.
+        Collect BoxPaintLayout items in paint order, hit testing them in the same walk.
         Args:
-            layout (QLayout): The layout to paint.
-            painter (QPainter): The painter to use.
+            layout (QLayout): The layout to walk.
             mouse_pos (QPoint, optional): Mouse position for hover detection.
-            hovered_layouts (set[BoxPaintLayout]): Layouts under the mouse.
+            visible (bool): False below a hidden layout, those are hit tested but not painted.
+            entries (list): Receives (layout, options, hit) tuples, options is None when hidden.
         """
-        if not layout or not layout.geometry().isValid():
+        if not layout:
+            return
+        rect = layout.geometry()
+        if not rect.isValid():
             return
         if isinstance(layout, BoxPaintLayout):
-            if not layout.flags & BoxPaintLayoutFlag.Visible:
-                return
-            options = PaintOptions.NoOptions
-            if layout.flags & BoxPaintLayoutFlag.Enabled:
-                if layout.widget() and layout.widget().isEnabled():
-                    options |= PaintOptions.Enabled
-            if layout in hovered_layouts:
-                options |= PaintOptions.Hovered
-            layout.paint(painter, options, mouse_pos)
+            flags = layout._flags_int
+            hit = (mouse_pos is not None and rect.contains(mouse_pos)
+                   and any(item.hit_test(rect, mouse_pos) for item in layout._paint_items))
+            visible = visible and bool(flags & _LAYOUT_VISIBLE)
+            options = None
+            if visible:
+                options = 0
+                if flags & _LAYOUT_ENABLED:
+                    if layout.widget() and layout.widget().isEnabled():
+                        options = _PAINT_ENABLED
+            if visible or hit:
+                entries.append((layout, options, hit))
         for i in range(layout.count()):
             item = layout.itemAt(i)
-            if item and isinstance(item, QtWidgets.QLayoutItem):
-                child_layout = item.layout()
-                cls._recurse_paint(child_layout, painter, mouse_pos, hovered_layouts)
+            child_layout = item.layout() if item else None
+            if child_layout:
+                cls._recurse_paint(child_layout, mouse_pos, visible, entries)
 
     @classmethod
     def render(cls, layout: QtWidgets.QLayout, painter: QtGui.QPainter, mouse_pos: Optional[QtCore.QPoint] = None):
@@ -413,19 +628,29 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
         rect = layout_geom
         if not rect.isValid() or rect.width() <= 0 or rect.height() <= 0:
             return
-        layouts = cls.hit_test(layout, mouse_pos)
+        entries = []
+        cls._recurse_paint(layout, mouse_pos, True, entries)
+        # Walking back from the innermost hit, layouts are hovered up to and including
+        # the first one that is not transparent for hover and has a hover style.
         hovered_layouts: Set[BoxPaintLayout] = set()
-        for each in reversed(layouts):
+        for each, _, hit in reversed(entries):
+            if not hit:
+                continue
             hovered_layouts.add(each)
-            if each.flags & BoxPaintLayoutFlag.TransparentForHover:
+            if each._flags_int & _LAYOUT_TRANSPARENT_FOR_HOVER:
                 continue
-            for item in each.get_paint_items():
+            for item in each._paint_items:
                 if item.shape and item.shape.hover_style:
                     break
             else:
                 continue
             break
-        cls._recurse_paint(layout, painter, mouse_pos, hovered_layouts)
+        for each, options, _ in entries:
+            if options is None:
+                continue
+            if each in hovered_layouts:
+                options |= _PAINT_HOVERED
+            each.paint(painter, options, mouse_pos)
 
     @staticmethod
     def hit_test(layout: QtWidgets.QLayout, pos: QtCore.QPoint, hit_items: Optional[List['BoxPaintLayout']] = None) -> List['BoxPaintLayout']:
@@ -444,10 +669,11 @@ class BoxPaintLayout(QtWidgets.QBoxLayout):
             return hit_items
         if isinstance(layout, BoxPaintLayout):
             rect = layout.geometry()
-            for item in layout._paint_items:
-                if item.hit_test(rect, pos):
-                    hit_items.append(layout)
-                    break
+            if rect.contains(pos):
+                for item in layout._paint_items:
+                    if item.hit_test(rect, pos):
+                        hit_items.append(layout)
+                        break
         for i in range(layout.count()):
             item = layout.itemAt(i)
             if not item or not item.geometry().isValid():
@@ -30,6 +30,9 @@ class FloatSlider(_AbstractSoftSlider):
         if clamped != self._value:
             self.value = clamped
 
+    def _slider_moved_args(self) -> 'tuple[float]':
+        return (self._value,)
+
     @QtCore.Property(float, notify=value_changed)
     def value(self) -> float:
         """Return the current value."""
@@ -37,7 +40,7 @@ class FloatSlider(_AbstractSoftSlider):
 
     @value.setter
     def value(self, value: float):
-        value = self._bound(float(value))
+        value = self._bound(value if type(value) is float else float(value))
         changed = False
         if self._soft_range is not None and value < self._soft_range[0]:
             self._soft_range = (value, self._soft_range[1])
@@ -57,17 +60,16 @@ class FloatSlider(_AbstractSoftSlider):
         """
         Paint the slider using QStylePainter and QStyleOptionSlider for native look and feel.
         """
-        visual_range = self._visual_range()
+        visual_range = self._get_visual_range()
         
         opt = QtWidgets.QStyleOptionSlider()
         opt.initFrom(self)
         opt.orientation = self._orientation
         # Allow for 4dp accuracy
-        mult = 10**self._decimals
+        mult = self._get_mult()
         opt.minimum = int(visual_range[0]*mult)
         opt.maximum = int(visual_range[1]*mult)
-        opt.sliderPosition = int(self._value*mult)
-        opt.sliderValue = int(self._value*mult)
+        opt.sliderPosition = opt.sliderValue = int(self._value*mult)
         opt.singleStep = int(self.single_step*mult)
         opt.pageStep = int(self.page_step*mult)
         opt.upsideDown = False
@@ -82,7 +84,7 @@ class FloatSlider(_AbstractSoftSlider):
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         if event.button() == QtCore.Qt.LeftButton:
-            groove_rect = self._groove_rect()
+            groove_rect = self._get_groove_rect()
             pos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
             if self._orientation == QtCore.Qt.Horizontal:
                 if pos.x() < groove_rect.left():
@@ -106,7 +108,7 @@ class FloatSlider(_AbstractSoftSlider):
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
         if self._slider_down:
-            groove_rect = self._groove_rect()
+            groove_rect = self._get_groove_rect()
             pos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
             if self._orientation == QtCore.Qt.Horizontal:
                 if pos.x() < groove_rect.left():
@@ -122,13 +124,14 @@ class FloatSlider(_AbstractSoftSlider):
                 pos.x() if self._orientation == QtCore.Qt.Horizontal else pos.y(),
                 groove_rect)
             self.value = val
-            self.slider_moved.emit(self._value)
+            self._schedule_slider_moved()
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
         if self._slider_down and event.button() == QtCore.Qt.LeftButton:
+            self._flush_slider_moved()
             self._slider_down = False
             self.slider_released.emit()
             event.accept()
@@ -147,9 +150,9 @@ class FloatSlider(_AbstractSoftSlider):
         elif key == QtCore.Qt.Key_PageDown:
             val -= self.page_step
         elif key == QtCore.Qt.Key_Home:
-            val = self._visual_range()[0]
+            val = self._get_visual_range()[0]
         elif key == QtCore.Qt.Key_End:
-            val = self._visual_range()[1]
+            val = self._get_visual_range()[1]
         else:
             super().keyPressEvent(event)
             return
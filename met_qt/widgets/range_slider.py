@@ -20,6 +20,14 @@ class RangeSlider(_AbstractSoftSlider):
         self._max_value: float = self._range[1]
         self._active_handle: Optional[str] = None  # 'min' or 'max'
         self._slider_down: bool = False
+        # Paint resources, rebuilt on resize, palette or enabled state changes
+        self._groove_pixmap: Optional[QtGui.QPixmap] = None
+        self._groove_pixmap_ratio = 0.0  # device pixel ratio the groove pixmap was rendered at
+        self._highlight_brush: Optional[QtGui.QBrush] = None
+        self._highlight_rect = QtCore.QRectF()  # mutated in place each paint
+        # Handle pixel positions of the last paint, used to skip repaints that would be identical
+        self._last_painted = (-1, -1)
+        self._last_painted_values = None  # type: Optional[tuple[float, float]]
         self.range_changed.connect(self._on_range_changed)
 
     def _on_range_changed(self, min_: float, max_: float):
@@ -30,16 +38,87 @@ class RangeSlider(_AbstractSoftSlider):
         self.slider_moved.emit(self._min_value, self._max_value)
         self.update()
 
+    def _invalidate_cache(self, *args):
+        super()._invalidate_cache()
+        self._groove_pixmap = None
+        self._last_painted = (-1, -1)
+        self._last_painted_values = None
+
+    def changeEvent(self, event: QtCore.QEvent):
+        if event.type() in (QtCore.QEvent.PaletteChange, QtCore.QEvent.EnabledChange):
+            self._groove_pixmap = None
+            self._highlight_brush = None
+        super().changeEvent(event)
+
+    def _get_groove_pixmap(self) -> QtGui.QPixmap:
+        """Return the cached groove pixmap, rendering it if required."""
+        pixmap = self._groove_pixmap
+        # The widget can move to a screen with a different device pixel ratio without a resize
+        ratio = self.devicePixelRatioF()
+        if pixmap is None or ratio != self._groove_pixmap_ratio:
+            pixmap = self._groove_pixmap = self._render_groove_pixmap(ratio)
+            self._groove_pixmap_ratio = ratio
+        return pixmap
+
+    def _render_groove_pixmap(self, ratio: float) -> QtGui.QPixmap:
+        """Render the groove at the given device pixel ratio."""
+        groove_rect = self._get_groove_rect()
+        if groove_rect.isEmpty():
+            return QtGui.QPixmap()
+        pixmap = QtGui.QPixmap(groove_rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        rect = QtCore.QRectF(0, 0, groove_rect.width(), groove_rect.height())
+        groove_color = self.palette().color(QtGui.QPalette.Button)
+        gradient = QtGui.QLinearGradient(rect.center().x(), rect.top(), rect.center().x(), rect.bottom())
+        gradient.setColorAt(0, groove_color)
+        gradient.setColorAt(1, groove_color.lighter(120))
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.end()
+        return pixmap
+
+    def _get_highlight_brush(self) -> QtGui.QBrush:
+        """Return the cached brush for the selected range."""
+        brush = self._highlight_brush
+        if brush is None:
+            if self.isEnabled():
+                highlight_color = self.palette().color(QtGui.QPalette.Highlight)
+            else:
+                highlight_color = self.palette().color(QtGui.QPalette.Disabled, QtGui.QPalette.Highlight)
+            brush = self._highlight_brush = QtGui.QBrush(highlight_color)
+        return brush
+
+    def _update_if_moved(self):
+        """Schedule a repaint only if a handle moved by at least a pixel since the last paint."""
+        groove_rect = self._get_groove_rect()
+        pixels = (self._value_to_pos(self._min_value, groove_rect),
+                  self._value_to_pos(self._max_value, groove_rect))
+        if pixels != self._last_painted:
+            self.update()
+
+    def _slider_moved_args(self) -> 'tuple[float, float]':
+        return (self._min_value, self._max_value)
+
+    def _notify_slider_moved(self):
+        """Emit slider_moved, coalesced to the move timer while a handle is dragged."""
+        if self._slider_down:
+            self._schedule_slider_moved()
+        else:
+            self._emit_slider_moved()
+
     @QtCore.Property(float, notify=min_value_changed)
     def min_value(self) -> float:
         return self._min_value
 
     @min_value.setter
     def min_value(self, value: float):
-        value = float(value)
-        value = min(max(value, self._range[0]), self._range[1])
-        if self.single_step > 0:
-            value = round(value / self.single_step) * self.single_step
+        value = self._bound(value if type(value) is float else float(value))
+        if value == self._min_value and value <= self._max_value:
+            return
         # Handle swapping if past max
         if value > self._max_value:
             old_min = self._min_value
@@ -51,8 +130,8 @@ class RangeSlider(_AbstractSoftSlider):
             self._min_value = value
         if old_min != self._min_value:
             self.min_value_changed.emit(self._min_value)
-            self.slider_moved.emit(self._min_value, self._max_value)
-            self.update()
+            self._notify_slider_moved()
+            self._update_if_moved()
 
     @QtCore.Property(float, notify=max_value_changed)
     def max_value(self) -> float:
@@ -60,10 +139,9 @@ class RangeSlider(_AbstractSoftSlider):
 
     @max_value.setter
     def max_value(self, value: float):
-        value = float(value)
-        value = min(max(value, self._range[0]), self._range[1])
-        if self.single_step > 0:
-            value = round(value / self.single_step) * self.single_step
+        value = self._bound(value if type(value) is float else float(value))
+        if value == self._max_value and value >= self._min_value:
+            return
         # Handle swapping if before min
         if value < self._min_value:
             old_max = self._max_value
@@ -75,128 +153,116 @@ class RangeSlider(_AbstractSoftSlider):
             self._max_value = value
         if old_max != self._max_value:
             self.max_value_changed.emit(self._max_value)
-            self.slider_moved.emit(self._min_value, self._max_value)
-            self.update()
+            self._notify_slider_moved()
+            self._update_if_moved()
 
     def paintEvent(self, event: QtGui.QPaintEvent):
-        visual_range = self._visual_range()
-        mult = 10 ** self._decimals
+        visual_range = self._get_visual_range()
+        mult = self._get_mult()
+        orientation = self._orientation
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        groove_rect = self._groove_rect()
+        groove_rect = self._get_groove_rect()
         min_center = self._value_to_pos(self._min_value, groove_rect)
         max_center = self._value_to_pos(self._max_value, groove_rect)
 
-        groove_color = self.palette().color(QtGui.QPalette.Button)
-        groove_color2 = groove_color.lighter(120)
-        groove_gradient = QtGui.QLinearGradient(
-            groove_rect.center().x(), groove_rect.top(),
-            groove_rect.center().x(), groove_rect.bottom()
-        )
-        groove_gradient.setColorAt(0, groove_color)
-        groove_gradient.setColorAt(1, groove_color2)
-        painter.save()
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(groove_gradient)
-        painter.drawRoundedRect(groove_rect, 3, 3)
-        painter.restore()
+        groove_pixmap = self._get_groove_pixmap()
+        if not groove_pixmap.isNull():
+            painter.drawPixmap(groove_rect.topLeft(), groove_pixmap)
 
-        if self.isEnabled():
-            highlight_color = self.palette().color(QtGui.QPalette.Highlight)
-        else:
-            highlight_color = self.palette().color(QtGui.QPalette.Disabled, QtGui.QPalette.Highlight)
         painter.save()
         painter.setPen(QtCore.Qt.NoPen)
-        painter.setBrush(QtGui.QBrush(highlight_color))
-        if self._orientation == QtCore.Qt.Horizontal:
-            y = groove_rect.top()
-            h = groove_rect.height()
+        painter.setBrush(self._get_highlight_brush())
+        highlight_rect = self._highlight_rect
+        if orientation == QtCore.Qt.Horizontal:
             left = min(min_center, max_center)
             right = max(min_center, max_center)
-            highlight_rect = QtCore.QRect(left, y, right - left, h)
+            highlight_rect.setRect(left, groove_rect.top(), right - left, groove_rect.height())
         else:
-            x = groove_rect.left()
-            w = groove_rect.width()
             top = min(min_center, max_center)
             bottom = max(min_center, max_center)
-            highlight_rect = QtCore.QRect(x, top, w, bottom - top)
+            highlight_rect.setRect(groove_rect.left(), top, groove_rect.width(), bottom - top)
         painter.drawRoundedRect(highlight_rect, 3, 3)
         painter.restore()
 
+        # The highlight is an axis aligned fill, only the handles need antialiasing
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         style = self.style()
         opt = QtWidgets.QStyleOptionSlider()
         opt.initFrom(self)
-        opt.orientation = self._orientation
+        opt.orientation = orientation
         opt.minimum = int(visual_range[0] * mult)
         opt.maximum = int(visual_range[1] * mult)
         opt.subControls = QtWidgets.QStyle.SC_SliderHandle
 
-        opt.sliderPosition = int(self._min_value * mult)
-        opt.sliderValue = int(self._min_value * mult)
-        opt.state = QtWidgets.QStyle.State_Enabled if self.isEnabled() else QtWidgets.QStyle.State_None
+        base_state = QtWidgets.QStyle.State_Enabled if self.isEnabled() else QtWidgets.QStyle.State_None
+        min_int = int(self._min_value * mult)
+        max_int = int(self._max_value * mult)
+
+        opt.sliderPosition = opt.sliderValue = min_int
+        opt.state = base_state
         if self._active_handle == 'min' and self._slider_down:
             opt.state |= QtWidgets.QStyle.State_Sunken
         style.drawComplexControl(QtWidgets.QStyle.CC_Slider, opt, painter, self)
 
-        opt.sliderPosition = int(self._max_value * mult)
-        opt.sliderValue = int(self._max_value * mult)
-        opt.state = QtWidgets.QStyle.State_Enabled if self.isEnabled() else QtWidgets.QStyle.State_None
+        opt.sliderPosition = opt.sliderValue = max_int
+        opt.state = base_state
         if self._active_handle == 'max' and self._slider_down:
             opt.state |= QtWidgets.QStyle.State_Sunken
         style.drawComplexControl(QtWidgets.QStyle.CC_Slider, opt, painter, self)
+        self._last_painted = (min_center, max_center)
+        self._last_painted_values = (self._min_value, self._max_value)
 
     def _pick_handle(self, pos):
         # Decide which handle is closer to the mouse position
-        groove_rect = self._groove_rect()
-        if self._orientation == QtCore.Qt.Horizontal:
-            min_pos = self._value_to_pos(self._min_value, groove_rect)
-            max_pos = self._value_to_pos(self._max_value, groove_rect)
-            if abs(pos.x() - min_pos) < abs(pos.x() - max_pos):
-                return 'min'
-            else:
-                return 'max'
+        if self._last_painted_values == (self._min_value, self._max_value):
+            # Handles are where they were last painted
+            min_pos, max_pos = self._last_painted
         else:
+            groove_rect = self._get_groove_rect()
             min_pos = self._value_to_pos(self._min_value, groove_rect)
             max_pos = self._value_to_pos(self._max_value, groove_rect)
-            if abs(pos.y() - min_pos) < abs(pos.y() - max_pos):
-                return 'min'
-            else:
-                return 'max'
+        p = pos.x() if self._orientation == QtCore.Qt.Horizontal else pos.y()
+        return 'min' if abs(p - min_pos) < abs(p - max_pos) else 'max'
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         if event.button() == QtCore.Qt.LeftButton:
-            groove_rect = self._groove_rect()
+            groove_rect = self._get_groove_rect()
             pos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
             self._active_handle = self._pick_handle(pos)
             self._slider_down = True
+            self.update()
             val = self._pos_to_value(pos.x() if self._orientation == QtCore.Qt.Horizontal else pos.y(), groove_rect)
             if self._active_handle == 'min':
                 self.min_value = val
             else:
                 self.max_value = val
-            self.slider_moved.emit(self._min_value, self._max_value)
+            # The press is reported immediately, along with any move queued by the setter
+            self._schedule_slider_moved()
+            self._flush_slider_moved()
             event.accept()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
         if self._slider_down and self._active_handle:
-            groove_rect = self._groove_rect()
+            groove_rect = self._get_groove_rect()
             pos = event.position().toPoint() if hasattr(event, 'position') else event.pos()
             val = self._pos_to_value(pos.x() if self._orientation == QtCore.Qt.Horizontal else pos.y(), groove_rect)
             if self._active_handle == 'min':
                 self.min_value = val
             else:
                 self.max_value = val
-            self.slider_moved.emit(self._min_value, self._max_value)
+            self._schedule_slider_moved()
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
         if self._slider_down and event.button() == QtCore.Qt.LeftButton:
+            self._flush_slider_moved()
             self._slider_down = False
             self._active_handle = None
+            self.update()
             self.slider_released.emit()
             event.accept()
         else:
@@ -217,9 +283,9 @@ class RangeSlider(_AbstractSoftSlider):
         elif key == QtCore.Qt.Key_PageDown:
             val -= self.page_step
         elif key == QtCore.Qt.Key_Home:
-            val = self._visual_range()[0]
+            val = self._get_visual_range()[0]
         elif key == QtCore.Qt.Key_End:
-            val = self._visual_range()[1]
+            val = self._get_visual_range()[1]
         else:
             super().keyPressEvent(event)
             return
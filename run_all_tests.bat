@@ -67,9 +67,9 @@ if %RUN_PYSIDE2%==1 (
         call venv-pyside2\Scripts\activate
         echo Installing dependencies for PySide2...
         python -m pip install --upgrade pip
-        pip install --no-index --find-links=.package_cache pytest pytest-qt PySide2==5.15.2 || (
-            pip download --dest=.package_cache pytest pytest-qt PySide2==5.15.2
-            pip install --no-index --find-links=.package_cache pytest pytest-qt PySide2==5.15.2
+        pip install --no-index --find-links=.package_cache pytest pytest-qt pytest-xdist PySide2==5.15.2 || (
+            pip download --dest=.package_cache pytest pytest-qt pytest-xdist PySide2==5.15.2
+            pip install --no-index --find-links=.package_cache pytest pytest-qt pytest-xdist PySide2==5.15.2
         )
         pip install -e .
         if errorlevel 1 (
@@ -82,7 +82,7 @@ if %RUN_PYSIDE2%==1 (
 
     echo Running tests with PySide2...
     call venv-pyside2\Scripts\activate.bat
-    pytest tests -vv
+    pytest tests -vv -n auto --dist=loadfile
     set PYSIDE2_RESULT=!errorlevel!
     call venv-pyside2\Scripts\deactivate.bat
     cd "%INITIAL_DIR%"
@@ -103,9 +103,9 @@ if %RUN_PYSIDE6%==1 (
         call venv-pyside6\Scripts\activate
         echo Installing dependencies for PySide6...
         python -m pip install --upgrade pip
-        pip install --no-index --find-links=.package_cache pytest pytest-qt PySide6 || (
-            pip download --dest=.package_cache pytest pytest-qt PySide6
-            pip install --no-index --find-links=.package_cache pytest pytest-qt PySide6
+        pip install --no-index --find-links=.package_cache pytest pytest-qt pytest-xdist PySide6 || (
+            pip download --dest=.package_cache pytest pytest-qt pytest-xdist PySide6
+            pip install --no-index --find-links=.package_cache pytest pytest-qt pytest-xdist PySide6
         )
         pip install -e .
         if errorlevel 1 (
@@ -118,7 +118,7 @@ if %RUN_PYSIDE6%==1 (
 
     echo Running tests with PySide6...
     call venv-pyside6\Scripts\activate.bat
-    pytest tests -vv
+    pytest tests -vv -n auto --dist=loadfile
     set PYSIDE6_RESULT=!errorlevel!
     call venv-pyside6\Scripts\deactivate.bat
     cd "%INITIAL_DIR%"
@@ -8,26 +8,45 @@ import pytest
 
 # No need to modify sys.path; met_qt is now at the root
 
+# Detect the Qt binding once, the hooks below share the result
+try:
+    from met_qt._internal import qtcompat
+    QT_BINDING = qtcompat.QT_BINDING
+except ImportError:
+    QT_BINDING = None
+
+@pytest.fixture(scope="session")
+def app(qapp):
+    """The QApplication shared by the whole session, created once by pytest-qt."""
+    return qapp
+
 # Skip tests that require Qt if no Qt bindings are available
 def pytest_configure(config):
     """Configure pytest."""
-    try:
-        from met_qt._internal import qtcompat
-        # Mark which binding is being used
-        if qtcompat.QT_BINDING == 'PySide6':
-            config.addinivalue_line("markers", "pyside6: mark test as requiring PySide6")
-        elif qtcompat.QT_BINDING == 'PySide2':
-            config.addinivalue_line("markers", "pyside2: mark test as requiring PySide2")
-    except ImportError:
+    # Mark which binding is being used
+    if QT_BINDING == 'PySide6':
+        config.addinivalue_line("markers", "pyside6: mark test as requiring PySide6")
+    elif QT_BINDING == 'PySide2':
+        config.addinivalue_line("markers", "pyside2: mark test as requiring PySide2")
+    elif QT_BINDING is None:
         # No Qt bindings available, add a skip marker
         config.addinivalue_line("markers", "qt: mark test as requiring Qt bindings")
 
+def pytest_report_header(config):
+    """Report the Qt binding, noting when it differs from the previous run."""
+    header = f"qt binding: {QT_BINDING or 'none'}"
+    # The cache is only used for reporting, tests never skip on the strength of a cached binding
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        previous = cache.get("qtcompat/binding", None)
+        if previous is not None and previous != QT_BINDING:
+            header += f" (previous run: {previous})"
+        cache.set("qtcompat/binding", QT_BINDING)
+    return header
+
 def pytest_collection_modifyitems(config, items):
     """Skip tests marked as requiring specific Qt versions if those bindings aren't available."""
-    try:
-        from met_qt._internal import qtcompat
-        qt_binding = qtcompat.QT_BINDING
-    except ImportError:
+    if QT_BINDING is None:
         # If no Qt bindings are available, skip all tests marked with qt
         skip_qt = pytest.mark.skip(reason="No Qt bindings available")
         for item in items:
@@ -36,15 +55,15 @@ def pytest_collection_modifyitems(config, items):
         return
     
     # Skip PySide6-specific tests if PySide2 is being used
-    if qt_binding == 'PySide2':
+    if QT_BINDING == 'PySide2':
         skip_pyside6 = pytest.mark.skip(reason="Test requires PySide6, but PySide2 is being used")
         for item in items:
             if "pyside6" in item.keywords:
                 item.add_marker(skip_pyside6)
     
     # Skip PySide2-specific tests if PySide6 is being used
-    elif qt_binding == 'PySide6':
+    elif QT_BINDING == 'PySide6':
         skip_pyside2 = pytest.mark.skip(reason="Test requires PySide2, but PySide6 is being used")
         for item in items:
             if "pyside2" in item.keywords:
-                item.add_marker(skip_pyside2)
\ No newline at end of file
+                item.add_marker(skip_pyside2)
@@ -1,5 +1,5 @@
 import pytest
-from met_qt._internal.qtcompat import QtWidgets
+from met_qt._internal.qtcompat import QtCore, QtWidgets
 from met_qt.core.binding import Bindings
 
 @pytest.fixture
@@ -102,3 +102,99 @@ def test_math_expression_binding(qtbot, bindings_widget):
     num1.setText("10")
     num2.setText("5")
     qtbot.waitUntil(lambda: result.value() == 15, timeout=20)
+
+def test_expression_binding_unknown_variable(bindings_widget):
+    first_name = bindings_widget['first_name']
+    full_name = bindings_widget['full_name']
+    bindings = bindings_widget['bindings']
+    with bindings.bind_expression(full_name, "text", "{first} {last}") as expr:
+        with pytest.raises(ValueError):
+            expr.bind("fir", first_name, "text")
+        expr.bind("first", first_name, "text")
+
+def test_coalesced_group_binding(qtbot, bindings_widget):
+    edit1 = bindings_widget['edit1']
+    edit2 = bindings_widget['edit2']
+    bindings = bindings_widget['bindings']
+    group = bindings.bind_group(coalesce=True)
+    group.add(edit1, "text")
+    group.add(edit2, "text")
+    edit1.setText("a")
+    edit1.setText("ab")
+    # Propagation is deferred until the event loop runs
+    assert edit2.text() == ""
+    qtbot.waitUntil(lambda: edit2.text() == "ab")
+
+def test_single_variable_expression_binding(qtbot, bindings_widget):
+    spinbox = bindings_widget['spinbox']
+    widget = bindings_widget['widget']
+    result = QtWidgets.QSpinBox()
+    widget.layout().addWidget(result)
+    bindings = bindings_widget['bindings']
+    with bindings.bind_expression(result, "value", "x") as expr:
+        expr.bind("x", spinbox, "value")
+    spinbox.setValue(7)
+    qtbot.waitUntil(lambda: result.value() == 7, timeout=20)
+
+def test_binding_removed_on_source_destroyed(bindings_widget):
+    spinbox = bindings_widget['spinbox']
+    bindings = bindings_widget['bindings']
+    source = QtWidgets.QSpinBox()
+    bindings.bind(source, "value").to(spinbox, "value")
+    source.setValue(3)
+    assert spinbox.value() == 3
+    source.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert not bindings._bindings
+    assert source not in bindings._observed_objects
+
+def test_binding_target_removed_on_destroyed(bindings_widget):
+    spinbox = bindings_widget['spinbox']
+    value_label = bindings_widget['value_label']
+    bindings = bindings_widget['bindings']
+    target = QtWidgets.QSpinBox()
+    binding = bindings.bind(spinbox, "value").to(target, "value").to(value_label, "text", str)
+    target.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert [t[0] for t in binding._targets] == [value_label]
+    spinbox.setValue(12)
+    assert value_label.text() == "12"
+
+def test_coalesced_one_way_binding(qtbot, bindings_widget):
+    spinbox = bindings_widget['spinbox']
+    value_label = bindings_widget['value_label']
+    bindings = Bindings(bindings_widget['widget'], coalesce=True)
+    bindings.bind(spinbox, "value").to(value_label, "text", str)
+    spinbox.setValue(5)
+    spinbox.setValue(6)
+    # Updates are deferred until the event loop runs
+    assert value_label.text() == "0"
+    qtbot.waitUntil(lambda: value_label.text() == "6")
+
+def test_bindings_is_parented_qobject(bindings_widget):
+    widget = bindings_widget['widget']
+    bindings = bindings_widget['bindings']
+    assert isinstance(bindings, QtCore.QObject)
+    assert bindings.parent() is widget
+    assert bindings in widget.children()
+
+def test_expression_binding_after_manager_deleted(bindings_widget):
+    spinbox = bindings_widget['spinbox']
+    value_label = bindings_widget['value_label']
+    bindings = Bindings()
+    expr = bindings.bind_expression(value_label, "text", "Value: {value}")
+    del bindings
+    with pytest.raises(RuntimeError):
+        expr.bind("value", spinbox, "value")
+
+def test_get_metamethod_same_named_classes():
+    from met_qt.core.meta import get_metamethod
+    # Two classes sharing a class name, with the signal at different method indices
+    def make_class(extra_signal):
+        namespace = {'other_changed': QtCore.Signal(int)} if extra_signal else {}
+        namespace['value_changed'] = QtCore.Signal(int)
+        return type('Source', (QtCore.QObject,), namespace)
+    first, second = make_class(False)(), make_class(True)()
+    for obj in (first, second):
+        method = get_metamethod(obj, obj.value_changed)
+        assert method.methodIndex() == obj.metaObject().indexOfSignal("value_changed(int)")
@@ -2,54 +2,54 @@ import pytest
 from met_qt._internal.qtcompat import QtCore, QtGui, QtWidgets
 from met_qt.core.model_data_mapper import ModelDataMapper
 
+USER_ROLE = int(QtCore.Qt.UserRole)
+
 class DummyWidget(QtWidgets.QWidget):
     valueChanged = QtCore.Signal(int)
     def __init__(self):
         super().__init__()
         self._value = 0
+        self._emit_value_changed = self.valueChanged.emit
     def setValue(self, v):
         self._value = v
-        self.valueChanged.emit(v)
+        self._emit_value_changed(v)
     def value(self):
         return self._value
 
-def create_simple_model():
+@pytest.fixture
+def simple_model():
+    # Function scoped, both tests write back into the model
     model = QtGui.QStandardItemModel()
     item = QtGui.QStandardItem("Test")
-    item.setData({"quantity": 42, "format": "usd"}, QtCore.Qt.UserRole)
+    item.setData({"quantity": 42, "format": "usd"}, USER_ROLE)
     model.appendRow(item)
     return model
 
-def test_model_data_mapper_basic(qtbot):
-    model = create_simple_model()
+@pytest.fixture
+def mapped(app, simple_model):
+    model = simple_model
     widget = DummyWidget()
     mapper = ModelDataMapper()
     mapper.set_model(model)
     mapper.add_mapping(
-        widget, "value", role=QtCore.Qt.UserRole,
+        widget, "value", role=USER_ROLE,
         from_model=lambda d: d.get("quantity", 0),
         from_property=lambda v, d: {**d, "quantity": v},
         signal=widget.valueChanged
     )
     mapper.set_current_index(0)
+    return model, widget, mapper
+
+def test_model_data_mapper_basic(mapped):
+    model, widget, mapper = mapped
     # Model to widget
     assert widget.value() == 42
     # Widget to model
     widget.setValue(99)
-    assert model.item(0).data(QtCore.Qt.UserRole)["quantity"] == 99
+    assert model.item(0).data(USER_ROLE)["quantity"] == 99
 
-def test_model_data_mapper_refresh(qtbot):
-    model = create_simple_model()
-    widget = DummyWidget()
-    mapper = ModelDataMapper()
-    mapper.set_model(model)
-    mapper.add_mapping(
-        widget, "value", role=QtCore.Qt.UserRole,
-        from_model=lambda d: d.get("quantity", 0),
-        from_property=lambda v, d: {**d, "quantity": v},
-        signal=widget.valueChanged
-    )
-    mapper.set_current_index(0)
-    model.item(0).setData({"quantity": 123, "format": "usd"}, QtCore.Qt.UserRole)
+def test_model_data_mapper_refresh(mapped):
+    model, widget, mapper = mapped
+    model.item(0).setData({"quantity": 123, "format": "usd"}, USER_ROLE)
     mapper.refresh()
     assert widget.value() == 123
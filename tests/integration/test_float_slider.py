@@ -1,27 +1,25 @@
 import pytest
 from met_qt.widgets.float_slider import FloatSlider
-from met_qt._internal.qtcompat import QtWidgets, QtCore
+from met_qt._internal.qtcompat import QtCore
 
-@pytest.fixture
-def app(qtbot):
-    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+@pytest.fixture(scope="module")
+def slider(app):
+    # Shared by the clamping cases, each one sets the value it checks
+    s = FloatSlider()
+    s.range = (0.0, 1.0)
+    s.single_step = 0.25
+    yield s
+    s.deleteLater()
 
-def test_float_slider_basic(app, qtbot):
-    slider = FloatSlider()
-    slider.range = (0.0, 1.0)
-    slider.single_step = 0.25
-    
-    # Test step size clamping
-    slider.value = 0.3  # Should clamp to 0.25
-    assert slider.value == 0.25
-    slider.value = 0.7  # Should clamp to 0.75
-    assert slider.value == 0.75
-    
-    # Test min/max clamping
-    slider.value = -0.5  # Should clamp to min
-    assert slider.value == 0.0
-    slider.value = 1.5  # Should clamp to max
-    assert slider.value == 1.0
+@pytest.mark.parametrize("value,expected", [
+    (0.3, 0.25),  # Step size clamping
+    (0.7, 0.75),
+    (-0.5, 0.0),  # Min/max clamping
+    (1.5, 1.0),
+])
+def test_float_slider_basic(slider, value, expected):
+    slider.value = value
+    assert slider.value == expected
 
 def test_float_slider_click(app, qtbot):
     slider = FloatSlider()
@@ -4,19 +4,35 @@ from met_qt.gui.paint_layout import BoxPaintLayout, BoxShape, BoxText, PaintStyl
 
 from met_qt._internal.qtcompat import QtWidgets, QtCore, QtGui
 
-@pytest.fixture
-def widget(qtbot):
+_HIT_RECT = QtCore.QRect(0, 0, 100, 100)
+_POS_INSIDE = QtCore.QPoint(10, 10)
+_POS_OUTSIDE = QtCore.QPoint(200, 200)
+
+@pytest.fixture(scope="module")
+def widget(qapp):
     w = QtWidgets.QWidget()
     layout = BoxPaintLayout()
     w.setLayout(layout)
-    qtbot.addWidget(w)
-    return w, layout
+    yield w, layout
+    w.close()
+    w.deleteLater()
+
+@pytest.fixture(scope="module")
+def sample_item():
+    # Read only, tests that change an item build their own
+    return BoxPaintItem(shape=BoxShape(style=PaintStyle(brush_color=QtGui.QColor('red'))), text=BoxText(text="Hello"))
+
+@pytest.fixture(autouse=True)
+def _reset_layout(widget):
+    # The widget is shared across the module, put the layout back to its defaults for each test
+    w, layout = widget
+    layout.set_paint_items([])
+    layout.setSizeHint(None)
+    layout.flags = int(BoxPaintLayoutFlag.Enabled | BoxPaintLayoutFlag.Visible)
 
-def test_box_paint_layout_add_and_get_items(widget):
+def test_box_paint_layout_add_and_get_items(widget, sample_item):
     w, layout = widget
-    shape = BoxShape(style=PaintStyle(brush_color=QtGui.QColor('red')))
-    text = BoxText(text="Hello")
-    item = BoxPaintItem(shape=shape, text=text)
+    item = sample_item
     layout.set_paint_items([item])
     assert layout.get_paint_items() == [item]
 
@@ -34,41 +50,131 @@ def test_box_paint_layout_flags(widget):
     layout.flags = int(BoxPaintLayoutFlag.Visible)
     assert layout.flags == int(BoxPaintLayoutFlag.Visible)
 
-def test_box_paint_item_hit_test(widget):
+def test_box_paint_item_hit_test(widget, sample_item):
     w, layout = widget
-    shape = BoxShape(style=PaintStyle(brush_color=QtGui.QColor('red')))
-    text = BoxText(text="Hello")
-    item = BoxPaintItem(shape=shape, text=text)
+    item = sample_item
     layout.set_paint_items([item])
     w.resize(100, 100)
-    rect = QtCore.QRect(0, 0, 100, 100)
-    pos_inside = QtCore.QPoint(10, 10)
-    pos_outside = QtCore.QPoint(200, 200)
-    assert item.hit_test(rect, pos_inside)
-    assert not item.hit_test(rect, pos_outside)
+    assert item.hit_test(_HIT_RECT, _POS_INSIDE)
+    assert not item.hit_test(_HIT_RECT, _POS_OUTSIDE)
 
-def test_box_paint_layout_paint_runs(widget, qtbot):
+def test_box_paint_layout_paint_runs(widget, sample_item):
     w, layout = widget
-    shape = BoxShape(style=PaintStyle(brush_color=QtGui.QColor('red')))
-    text = BoxText(text="Hello")
-    item = BoxPaintItem(shape=shape, text=text)
+    item = sample_item
     layout.set_paint_items([item])
     w.resize(100, 100)
-    pixmap = QtGui.QPixmap(100, 100)
-    pixmap.fill(QtCore.Qt.GlobalColor.white)
-    painter = QtGui.QPainter(pixmap)
+    image = QtGui.QImage(100, 100, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.GlobalColor.white)
+    painter = QtGui.QPainter(image)
     layout.paint(painter, 0)
     painter.end()
 
-def test_box_paint_layout_render_runs(widget, qtbot):
+def test_box_paint_layout_render_runs(widget, sample_item):
     w, layout = widget
-    shape = BoxShape(style=PaintStyle(brush_color=QtGui.QColor('red')))
-    text = BoxText(text="Hello")
-    item = BoxPaintItem(shape=shape, text=text)
+    item = sample_item
     layout.set_paint_items([item])
     w.resize(100, 100)
-    pixmap = QtGui.QPixmap(100, 100)
-    pixmap.fill(QtCore.Qt.GlobalColor.white)
-    painter = QtGui.QPainter(pixmap)
+    image = QtGui.QImage(100, 100, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.GlobalColor.white)
+    painter = QtGui.QPainter(image)
     BoxPaintLayout.render(layout, painter)
     painter.end()
+
+def test_role_color_follows_palette_changes(widget):
+    from met_qt.gui.paint_layout import _role_color
+    w, layout = widget
+    role = QtGui.QPalette.ColorRole.Highlight
+    palette = w.palette()
+    palette.setColor(role, QtGui.QColor('red'))
+    w.setPalette(palette)
+    assert _role_color(w.palette(), role) == QtGui.QColor('red')
+    palette.setColor(role, QtGui.QColor('blue'))
+    w.setPalette(palette)
+    assert _role_color(w.palette(), role) == QtGui.QColor('blue')
+
+def test_role_color_follows_color_group():
+    from met_qt.gui.paint_layout import _role_color
+    role = QtGui.QPalette.ColorRole.Highlight
+    palette = QtGui.QPalette()
+    palette.setColor(QtGui.QPalette.ColorGroup.Active, role, QtGui.QColor('red'))
+    palette.setColor(QtGui.QPalette.ColorGroup.Disabled, role, QtGui.QColor('blue'))
+    palette.setCurrentColorGroup(QtGui.QPalette.ColorGroup.Active)
+    assert _role_color(palette, role) == QtGui.QColor('red')
+    palette.setCurrentColorGroup(QtGui.QPalette.ColorGroup.Disabled)
+    assert _role_color(palette, role) == QtGui.QColor('blue')
+
+def test_box_paint_layout_size_hint_updates_with_items(widget):
+    w, layout = widget
+    item = BoxPaintItem(shape=BoxShape(content_margin=0), text=BoxText(text="Hi"))
+    layout.set_paint_items([item])
+    short_hint = layout.sizeHint()
+    item.text.text = "A much longer line of text"
+    layout.invalidate()
+    assert layout.sizeHint().width() > short_hint.width()
+
+@pytest.fixture
+def restore_app_style(qapp):
+    # setStyle replaces the style for the whole process, put the original back for later tests
+    name = QtWidgets.QApplication.style().objectName()
+    yield
+    QtWidgets.QApplication.setStyle(name)
+
+def test_box_paint_item_follows_application_style_changes(restore_app_style):
+    # Painting without a widget uses the application style, which setStyle deletes
+    item = BoxPaintItem(text=BoxText(text="Hello"))
+    image = QtGui.QImage(100, 100, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.GlobalColor.white)
+    painter = QtGui.QPainter(image)
+    item.paint(painter, _HIT_RECT)
+    QtWidgets.QApplication.setStyle("Fusion")
+    item.paint(painter, _HIT_RECT)
+    painter.end()
+
+def test_box_paint_item_path_cache_follows_replaced_path():
+    def triangle(points):
+        path = QtGui.QPainterPath()
+        path.addPolygon(QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in points]))
+        path.closeSubpath()
+        return path
+    shape = BoxShape(shape_type=ShapeType.Path, painter_path=triangle([(0, 0), (100, 0), (0, 100)]))
+    item = BoxPaintItem(shape=shape)
+    assert item.hit_test(_HIT_RECT, _POS_INSIDE)
+    # Replace the path with its mirror, the point near the top left is now outside
+    shape.painter_path = triangle([(100, 0), (100, 100), (0, 100)])
+    assert not item.hit_test(_HIT_RECT, _POS_INSIDE)
+
+def test_box_paint_item_uses_disabled_colors(qapp):
+    role = QtGui.QPalette.ColorRole.Highlight
+    w = QtWidgets.QWidget()
+    palette = w.palette()
+    palette.setColor(QtGui.QPalette.ColorGroup.Active, role, QtGui.QColor('red'))
+    palette.setColor(QtGui.QPalette.ColorGroup.Inactive, role, QtGui.QColor('red'))
+    palette.setColor(QtGui.QPalette.ColorGroup.Disabled, role, QtGui.QColor('blue'))
+    w.setPalette(palette)
+    item = BoxPaintItem(shape=BoxShape(style=PaintStyle(brush_role=role)))
+    image = QtGui.QImage(100, 100, QtGui.QImage.Format_ARGB32_Premultiplied)
+    def painted_color():
+        image.fill(QtCore.Qt.GlobalColor.white)
+        painter = QtGui.QPainter(image)
+        item.paint(painter, _HIT_RECT, widget=w)
+        painter.end()
+        return image.pixelColor(50, 50)
+    assert painted_color() == QtGui.QColor('red')
+    w.setEnabled(False)
+    assert painted_color() == QtGui.QColor('blue')
+    w.deleteLater()
+
+def test_app_defaults_reset_once_per_style_change(restore_app_style, monkeypatch):
+    resets = []
+    original_reset = BoxPaintItem.reset_app_defaults.__func__
+    def counting_reset(cls):
+        resets.append(cls)
+        original_reset(cls)
+    monkeypatch.setattr(BoxPaintItem, 'reset_app_defaults', classmethod(counting_reset))
+    # Re-resolving the defaults for the same style must not connect to it again
+    for _ in range(3):
+        BoxPaintItem.reset_app_defaults()
+        BoxPaintItem._app_defaults()
+    del resets[:]
+    QtWidgets.QApplication.setStyle("Fusion")
+    assert len(resets) == 1
@@ -2,51 +2,64 @@ import pytest
 from met_qt.gui import paint_utils
 from met_qt._internal.qtcompat import QtWidgets, QtCore, QtGui
 
-@pytest.fixture
-def painter_and_pixmap(qtbot):
-    widget = QtWidgets.QWidget()
-    qtbot.addWidget(widget)
-    pixmap = QtGui.QPixmap(100, 100)
-    pixmap.fill(QtCore.Qt.white)
-    painter = QtGui.QPainter(pixmap)
-    yield painter, pixmap
+# Shared geometry, only ever passed by value into the paint calls
+_TEXT_RECT = QtCore.QRect(10, 10, 80, 20)
+_BOX_RECT = QtCore.QRect(10, 10, 80, 80)
+_OPTION_RECT = QtCore.QRect(10, 10, 20, 20)
+_POINT = QtCore.QPoint(5, 5)
+
+@pytest.fixture(scope="module")
+def painter_and_image(app):
+    # A raster image keeps painting off any native pixmap backend
+    image = QtGui.QImage(100, 100, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.white)
+    painter = QtGui.QPainter(image)
+    yield painter, image
     painter.end()
 
-def test_draw_text(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
-    rect = paint_utils.draw_text(painter, QtCore.QRect(10, 10, 80, 20), 0, "Hello")
+@pytest.fixture(autouse=True)
+def _clean_painter(painter_and_image):
+    # The painter is shared across the module, clear the image and isolate painter state per test
+    painter, image = painter_and_image
+    painter.fillRect(image.rect(), QtCore.Qt.white)
+    painter.save()
+    yield
+    painter.restore()
+
+def test_draw_text(painter_and_image):
+    painter, _ = painter_and_image
+    rect = paint_utils.draw_text(painter, _TEXT_RECT, 0, "Hello")
     assert rect.width() > 0 and rect.height() > 0
 
-def test_draw_partially_rounded_rect(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
-    rect = paint_utils.draw_partially_rounded_rect(painter, QtCore.QRect(10, 10, 80, 80), 10, 10, 10, 10)
+def test_draw_partially_rounded_rect(painter_and_image):
+    painter, _ = painter_and_image
+    rect = paint_utils.draw_partially_rounded_rect(painter, _BOX_RECT, 10, 10, 10, 10)
     assert rect.width() > 0 and rect.height() > 0
 
-def test_draw_path(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
+def test_draw_path(painter_and_image):
+    painter, _ = painter_and_image
     path = QtGui.QPainterPath()
     path.addRect(20, 20, 40, 40)
     rect = paint_utils.draw_path(painter, path)
     assert rect.width() > 0 and rect.height() > 0
 
-def test_anchor(qtbot):
+def test_anchor():
     rect = paint_utils.anchor((50, 50), left=10, top=10)
     assert rect.width() > 0 and rect.height() > 0
 
-def test_to_global_and_from_global(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
-    point = QtCore.QPoint(5, 5)
-    global_point = paint_utils.to_global(painter, point)
+def test_to_global_and_from_global(painter_and_image):
+    painter, _ = painter_and_image
+    global_point = paint_utils.to_global(painter, _POINT)
     widget_point = paint_utils.from_global(painter, global_point)
     assert isinstance(global_point, QtCore.QPoint)
     assert isinstance(widget_point, QtCore.QPoint)
 
-def test_draw_item_text(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
+def test_draw_item_text(painter_and_image):
+    painter, _ = painter_and_image
     palette = QtGui.QPalette()
     rect = paint_utils.draw_item_text(
         painter,
-        QtCore.QRect(10, 10, 80, 20),
+        _TEXT_RECT,
         QtCore.Qt.AlignLeft,
         palette,
         True,
@@ -54,11 +67,11 @@ def test_draw_item_text(painter_and_pixmap):
     )
     assert rect.width() >= 0 and rect.height() >= 0
 
-def test_draw_primitive(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
+def test_draw_primitive(painter_and_image):
+    painter, _ = painter_and_image
     style = QtWidgets.QApplication.style()
     option = QtWidgets.QStyleOption()
-    option.rect = QtCore.QRect(10, 10, 20, 20)
+    option.rect = _OPTION_RECT
     rect = paint_utils.draw_primitive(
         painter,
         QtWidgets.QStyle.PE_Frame,
@@ -68,11 +81,11 @@ def test_draw_primitive(painter_and_pixmap):
     )
     assert rect.width() > 0 and rect.height() > 0
 
-def test_draw_control(painter_and_pixmap):
-    painter, _ = painter_and_pixmap
+def test_draw_control(painter_and_image):
+    painter, _ = painter_and_image
     style = QtWidgets.QApplication.style()
     option = QtWidgets.QStyleOption()
-    option.rect = QtCore.QRect(10, 10, 20, 20)
+    option.rect = _OPTION_RECT
     rect = paint_utils.draw_control(
         painter,
         QtWidgets.QStyle.CE_PushButton,
@@ -1,12 +1,8 @@
 import pytest
 from met_qt.widgets.range_slider import RangeSlider
-from met_qt._internal.qtcompat import QtWidgets
+from met_qt._internal.qtcompat import QtCore
 
-@pytest.fixture
-def app(qtbot):
-    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
-
-def test_range_slider_basic(app, qtbot):
+def test_range_slider_basic(app):
     slider = RangeSlider()
     slider.range = (0.0, 10.0)
     slider.soft_range = (2.0, 8.0)
@@ -20,3 +16,87 @@ def test_range_slider_basic(app, qtbot):
     slider.max_value = -2.0  # Should swap and clamp
     assert slider.max_value == 7.0
     assert slider.min_value == 0.0
+
+def test_range_slider_cache_invalidation(app, qtbot):
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 24)
+    slider.show()
+    qtbot.waitExposed(slider)
+    assert slider._get_groove_rect() == slider._groove_rect()
+    slider.range = (0.0, 10.0)
+    assert slider._get_visual_range() == (0.0, 10.0)
+    slider.soft_range = (2.0, 8.0)
+    assert slider._get_visual_range() == (2.0, 8.0)
+    slider.resize(300, 24)
+    qtbot.waitUntil(lambda: slider.width() == 300)
+    assert slider._get_groove_rect() == slider._groove_rect()
+    slider.orientation = QtCore.Qt.Vertical
+    assert slider._get_groove_rect() == slider._groove_rect()
+
+def test_range_slider_step_rounding(app):
+    slider = RangeSlider()
+    slider.range = (0.0, 1.0)
+    slider.single_step = 0.1
+    # 0.35 / 0.1 is just below 3.5 in floating point, so it snaps down
+    assert slider._bound(0.35) == pytest.approx(0.3)
+    assert slider._bound(0.36) == pytest.approx(0.4)
+
+def test_range_slider_pick_handle(app, qtbot):
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 24)
+    slider.range = (0.0, 10.0)
+    slider.min_value = 2.0
+    slider.max_value = 8.0
+    slider.show()
+    qtbot.waitExposed(slider)
+    groove_rect = slider._get_groove_rect()
+    y = groove_rect.center().y()
+    near_min = QtCore.QPoint(slider._value_to_pos(3.0, groove_rect), y)
+    near_max = QtCore.QPoint(slider._value_to_pos(7.0, groove_rect), y)
+    assert slider._pick_handle(near_min) == 'min'
+    assert slider._pick_handle(near_max) == 'max'
+    # Moving a handle without a repaint must not use stale positions
+    slider.max_value = 3.5
+    assert slider._pick_handle(near_min) == 'max'
+
+def test_range_slider_drag_coalesces_slider_moved(app, qtbot):
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 24)
+    slider.range = (0.0, 10.0)
+    slider.single_step = 0.001
+    slider.show()
+    qtbot.waitExposed(slider)
+    emitted = []
+    slider.slider_moved.connect(lambda min_, max_: emitted.append((min_, max_)))
+    y = slider._get_groove_rect().center().y()
+    qtbot.mousePress(slider, QtCore.Qt.LeftButton, pos=QtCore.QPoint(150, y))
+    assert len(emitted) == 1
+    for x in range(150, 94, -1):
+        qtbot.mouseMove(slider, QtCore.QPoint(x, y))
+    # Moves made during a drag are only reported on the next timer tick
+    assert len(emitted) == 1
+    qtbot.waitUntil(lambda: len(emitted) == 2)
+    assert emitted[-1] == (slider.min_value, slider.max_value)
+    qtbot.mouseRelease(slider, QtCore.Qt.LeftButton, pos=QtCore.QPoint(95, y))
+    assert len(emitted) == 2
+
+def test_range_slider_groove_pixmap_follows_device_pixel_ratio(app, qtbot):
+    slider = RangeSlider()
+    qtbot.addWidget(slider)
+    slider.resize(200, 24)
+    pixmap = slider._get_groove_pixmap()
+    assert pixmap.devicePixelRatio() == slider.devicePixelRatioF()
+    # Moving to a screen with another ratio doesn't resize the widget
+    ratio = slider.devicePixelRatioF() * 2
+    slider.devicePixelRatioF = lambda: ratio
+    assert slider._get_groove_pixmap().devicePixelRatio() == ratio
+
+def test_abstract_slider_requires_slider_moved_args(app):
+    from met_qt._internal.widgets.abstract_slider import AbstractSoftSlider
+    class IncompleteSlider(AbstractSoftSlider):
+        slider_moved = QtCore.Signal(float)
+    with pytest.raises(TypeError):
+        IncompleteSlider()
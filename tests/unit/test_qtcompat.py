@@ -13,15 +13,53 @@ import sys
 # Import the module under test
 from met_qt._internal import qtcompat
 
-@pytest.mark.parametrize('qt_binding', [qtcompat.QT_BINDING])
+class _NoBoundValuesQuery:
+    """Query stand in without a boundValues method."""
+
+class _BoundValuesQuery:
+    """Query stand in returning fixed bound values."""
+    def __init__(self, values):
+        self._values = values
+
+    def boundValues(self):
+        return self._values
+
+class _Qt6TouchEvent:
+    """Qt 6 touch event stand in, only points() is available."""
+    def __init__(self, points):
+        self._points = points
+        self.calls = 0
+
+    def points(self):
+        self.calls += 1
+        return self._points
+
+class _Qt5TouchEvent:
+    """Qt 5 touch event stand in, only touchPoints() is available."""
+    def __init__(self, points):
+        self._points = points
+        self.calls = 0
+
+    def touchPoints(self):
+        self.calls += 1
+        return self._points
+
+@pytest.fixture
+def mock_qapp_patcher():
+    """Patch QApplication for a single test so create_application never builds a real one."""
+    patcher = mock.patch(f'{qtcompat.QT_BINDING}.QtWidgets.QApplication')
+    mock_qapp = patcher.start()
+    yield mock_qapp
+    patcher.stop()
+
 class TestQtCompat:
     """Test the Qt compatibility layer functions."""
     
     @pytest.fixture(autouse=True)
-    def setup_qt_binding(self, qt_binding):
-        """Setup the Qt binding for each test."""
+    def setup_qt_binding(self):
+        """Restore the detected Qt binding after each test."""
         self.original_binding = qtcompat.QT_BINDING
-        with mock.patch.object(qtcompat, 'QT_BINDING', qt_binding):
+        with mock.patch.object(qtcompat, 'QT_BINDING', self.original_binding):
             yield
         qtcompat.QT_BINDING = self.original_binding
     
@@ -43,65 +81,52 @@ class TestQtCompat:
                 assert nonexistent_module is None
                 mock_warn.assert_called_once()
     
-    def test_create_application(self):
+    def test_create_application(self, mock_qapp_patcher):
         """Test the create_application function."""
-        # Mock QApplication to avoid creating a real one during tests
-        with mock.patch(f'{qtcompat.QT_BINDING}.QtWidgets.QApplication') as mock_qapp:
-            # Test with default args
-            qtcompat.create_application()
-            mock_qapp.assert_called_once()
-            args = mock_qapp.call_args[0][0]
-            assert args == sys.argv
-            
-            mock_qapp.reset_mock()
-            
-            # Test with custom args
-            custom_args = ['test', '--arg1', '--arg2']
-            qtcompat.create_application(custom_args)
-            mock_qapp.assert_called_once()
-            args = mock_qapp.call_args[0][0]
-            assert args == custom_args
+        mock_qapp = mock_qapp_patcher
+        # Test with default args
+        qtcompat.create_application()
+        mock_qapp.assert_called_once()
+        args = mock_qapp.call_args[0][0]
+        assert args == sys.argv
+        
+        mock_qapp.reset_mock()
+        
+        # Test with custom args
+        custom_args = ['test', '--arg1', '--arg2']
+        qtcompat.create_application(custom_args)
+        mock_qapp.assert_called_once()
+        args = mock_qapp.call_args[0][0]
+        assert args == custom_args
     
     def test_get_query_bound_values(self):
         """Test the get_query_bound_values function."""
-        # Create a mock query object without boundValues
-        mock_query_no_bound = mock.Mock(spec=[])
-        result = qtcompat.get_query_bound_values(mock_query_no_bound)
+        # A query without boundValues
+        result = qtcompat.get_query_bound_values(_NoBoundValuesQuery())
         assert result == {}
         
         if qtcompat.QT_BINDING == 'PySide6':
             # Test PySide6-like query (returns dict)
-            mock_query = mock.Mock()
             expected_dict = {'param1': 'value1', 'param2': 'value2'}
-            mock_query.boundValues.return_value = expected_dict
-            result = qtcompat.get_query_bound_values(mock_query)
+            result = qtcompat.get_query_bound_values(_BoundValuesQuery(expected_dict))
             assert result == expected_dict
             
         else:
             # Test PySide2-like query (returns list)
-            mock_query = mock.Mock()
             bound_list = ['value1', 'value2']
             expected_dict = {0: 'value1', 1: 'value2'}
-            mock_query.boundValues.return_value = bound_list
-            result = qtcompat.get_query_bound_values(mock_query)
+            result = qtcompat.get_query_bound_values(_BoundValuesQuery(bound_list))
             assert result == expected_dict
     
     def test_get_touch_points(self):
         """Test the get_touch_points function."""
+        touch_points = [object(), object()]
         if qtcompat.QT_BINDING == 'PySide6':
             # Test PySide6 behavior (uses points method)
-            mock_touch_event = mock.Mock()
-            touch_points = [mock.Mock(), mock.Mock()]
-            mock_touch_event.points.return_value = touch_points
-            result = qtcompat.get_touch_points(mock_touch_event)
-            mock_touch_event.points.assert_called_once()
-            assert result == touch_points
-            
+            touch_event = _Qt6TouchEvent(touch_points)
         else:
             # Test PySide2 behavior (uses touchPoints method)
-            mock_touch_event = mock.Mock()
-            touch_points = [mock.Mock(), mock.Mock()]
-            mock_touch_event.touchPoints.return_value = touch_points
-            result = qtcompat.get_touch_points(mock_touch_event)
-            mock_touch_event.touchPoints.assert_called_once()
-            assert result == touch_points
+            touch_event = _Qt5TouchEvent(touch_points)
+        result = qtcompat.get_touch_points(touch_event)
+        assert touch_event.calls == 1
+        assert result == touch_points